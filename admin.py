@@ -1,112 +1,166 @@
+import functools
 import streamlit as st
 import utils
+from typing import Tuple
+
+# Component list keys and their display names, in display order
+COMPONENT_SPECS = (
+    ("calibre", "Calibre"),
+    ("rifle", "Rifle"),
+    ("case_brand", "Case Brand"),
+    ("powder_brand", "Powder Brand"),
+    ("powder_model", "Powder Model"),
+    ("bullet_brand", "Bullet Brand"),
+    ("bullet_model", "Bullet Model"),
+    ("primer_brand", "Primer Brand"),
+    ("primer_model", "Primer Model"),
+    ("brass_sizing", "Brass Sizing"),
+)
+COMPONENT_KEYS = tuple(key for key, _ in COMPONENT_SPECS)
+COMPONENT_NAMES = tuple(name for _, name in COMPONENT_SPECS)
+# Prefixes of the per-row edit and delete widget keys, see row_widget_keys()
+COMPONENT_ROW_KEY_PREFIXES = tuple(
+    prefix for key in COMPONENT_KEYS for prefix in (f"{key}_", f"del_{key}_")
+)
+
+_PAGE_CFG = {
+    "page_title": "Component List Admin",
+    "page_icon": "🔧",
+    "layout": "wide",
+    "initial_sidebar_state": "expanded",
+}
+
+@functools.lru_cache(maxsize=128)
+def row_widget_keys(component_key: str, n: int) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Build the row labels and widget keys for a component list.
+    
+    Args:
+        component_key: Component list key, e.g. "calibre"
+        n: Number of items in the list
+        
+    Returns:
+        Tuple of (labels, edit keys, delete keys), one entry per row
+    """
+    labels = tuple(f"Item {j+1}" for j in range(n))
+    edit_keys = tuple(f"{component_key}_{j}" for j in range(n))
+    delete_keys = tuple(f"del_{component_key}_{j}" for j in range(n))
+    return labels, edit_keys, delete_keys
 
 def main():
-    st.set_page_config(
-        page_title="Component List Admin",
-        page_icon="🔧",
-        layout="wide",
-        initial_sidebar_state="expanded",
-    )
+    st.set_page_config(**_PAGE_CFG)
 
     st.title("Component List Administration")
     st.markdown("---")
     
     # Add a link back to the main app
     st.sidebar.markdown("### Navigation")
-    if st.sidebar.button("Back to Main App"):
-        import webbrowser
-        webbrowser.open("http://localhost:8501")
+    st.sidebar.link_button("Back to Main App", "http://localhost:8501")
     
-    # Load component lists
-    component_lists = utils.load_component_lists()
+    # Load component lists into a per-session working copy. Edits mark it
+    # dirty and are written to disk once at the end of the run.
+    st.session_state.setdefault("component_lists_dirty", False)
+    version = utils.get_component_lists_version()
+    if st.session_state.get("component_lists_version") != version:
+        if "component_lists_working" in st.session_state:
+            # The file was written by another tab, session or by hand since
+            # it was loaded, so start again from what is on disk rather than
+            # overwriting it. Row edits made against the old lists are
+            # dropped, as they are matched to items by position.
+            for key in list(st.session_state):
+                if key.startswith("_idx_") or key.startswith(COMPONENT_ROW_KEY_PREFIXES):
+                    del st.session_state[key]
+            st.warning("The component lists were changed elsewhere and have been reloaded.")
+        st.session_state["component_lists_working"] = utils.load_component_lists()
+        st.session_state["component_lists_version"] = utils.get_component_lists_version()
+    component_lists = st.session_state["component_lists_working"]
+    needs_rerun = False
     
-    # Create tabs for each component type
-    tabs = st.tabs([
-        "Calibre", 
-        "Rifle", 
-        "Case Brand", 
-        "Powder Brand", 
-        "Powder Model", 
-        "Bullet Brand", 
-        "Bullet Model", 
-        "Primer Brand", 
-        "Primer Model",
-        "Brass Sizing"
-    ])
+    # Only the selected component list is rendered on each run
+    component_name = st.sidebar.radio(
+        "Component",
+        options=COMPONENT_NAMES,
+        key="active_component"
+    )
     
-    # Map tab indices to component list keys and names
-    component_info = [
-        {"key": "calibre", "name": "Calibre"},
-        {"key": "rifle", "name": "Rifle"},
-        {"key": "case_brand", "name": "Case Brand"},
-        {"key": "powder_brand", "name": "Powder Brand"},
-        {"key": "powder_model", "name": "Powder Model"},
-        {"key": "bullet_brand", "name": "Bullet Brand"},
-        {"key": "bullet_model", "name": "Bullet Model"},
-        {"key": "primer_brand", "name": "Primer Brand"},
-        {"key": "primer_model", "name": "Primer Model"},
-        {"key": "brass_sizing", "name": "Brass Sizing"}
-    ]
+    # Display and edit the selected component list
+    component_key = COMPONENT_KEYS[COMPONENT_NAMES.index(component_name)]
     
-    # Display and edit each component list
-    for i, tab in enumerate(tabs):
-        with tab:
-            component_key = component_info[i]["key"]
-            component_name = component_info[i]["name"]
-            
-            st.header(f"{component_name} List")
-            
-            # Display current items
-            st.subheader("Current Items")
-            items = component_lists.get(component_key, [])
-            
-            # Create a container for the items
-            item_container = st.container()
-            
-            # Add new item
-            st.subheader("Add New Item")
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                new_item = st.text_input(f"New {component_name}", key=f"new_{component_key}")
-            with col2:
-                add_button = st.button("Add", key=f"add_{component_key}")
+    st.header(f"{component_name} List")
+    
+    # Display current items
+    st.subheader("Current Items")
+    items = component_lists.get(component_key, [])
+    # Membership index kept alongside the working copy for O(1) lookups
+    idx = st.session_state.setdefault(f"_idx_{component_key}", set(items))
+    
+    # Create a container for the items
+    item_container = st.container()
+    
+    # Add new item
+    st.subheader("Add New Item")
+    with st.form(f"add_form_{component_key}", clear_on_submit=True):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            new_item = st.text_input(f"New {component_name}", key=f"new_{component_key}")
+        with col2:
+            add_button = st.form_submit_button("Add")
+    
+    if add_button and new_item:
+        if new_item not in idx:
+            items.append(new_item)
+            idx.add(new_item)
+            component_lists[component_key] = items
+            st.session_state["component_lists_dirty"] = True
+            st.success(f"Added '{new_item}' to {component_name} list")
+        else:
+            st.warning(f"'{new_item}' already exists in {component_name} list")
+    
+    # Display and allow editing of items. All renames and deletions are
+    # collected in one form and applied together on submit.
+    with item_container:
+        if not items:
+            st.info(f"No {component_name} items found. Add some using the form below.")
+        else:
+            labels, edit_keys, delete_keys = row_widget_keys(component_key, len(items))
+            with st.form(f"edit_form_{component_key}", clear_on_submit=False):
+                edited = []
+                for j, item in enumerate(items):
+                    col1, col2 = st.columns([4, 1])
+                    with col1:
+                        edited_item = st.text_input(labels[j], value=item, key=edit_keys[j])
+                    with col2:
+                        delete_item = st.checkbox("Delete", key=delete_keys[j])
+                    edited.append((edited_item, delete_item))
+                
+                apply_button = st.form_submit_button("Apply changes")
             
-            if add_button and new_item:
-                if new_item not in items:
-                    items.append(new_item)
+            if apply_button:
+                kept = [edited_item for edited_item, delete_item in edited if not delete_item]
+                if kept != items:
+                    # Row widgets are keyed by position, so drop their state
+                    # before the rows shift
+                    for key in edit_keys + delete_keys:
+                        st.session_state.pop(key, None)
+                    
+                    items[:] = kept
+                    idx.clear()
+                    idx.update(kept)
                     component_lists[component_key] = items
-                    utils.save_component_lists(component_lists)
-                    st.success(f"Added '{new_item}' to {component_name} list")
-                else:
-                    st.warning(f"'{new_item}' already exists in {component_name} list")
-            
-            # Display and allow editing of items
-            with item_container:
-                if not items:
-                    st.info(f"No {component_name} items found. Add some using the form below.")
-                else:
-                    for j, item in enumerate(items):
-                        col1, col2, col3 = st.columns([3, 1, 1])
-                        with col1:
-                            edited_item = st.text_input(f"Item {j+1}", value=item, key=f"{component_key}_{j}")
-                        with col2:
-                            update_button = st.button("Update", key=f"update_{component_key}_{j}")
-                        with col3:
-                            delete_button = st.button("Delete", key=f"delete_{component_key}_{j}")
-                        
-                        if update_button and edited_item != item:
-                            items[j] = edited_item
-                            component_lists[component_key] = items
-                            utils.save_component_lists(component_lists)
-                            st.success(f"Updated '{item}' to '{edited_item}'")
-                        
-                        if delete_button:
-                            items.remove(item)
-                            component_lists[component_key] = items
-                            utils.save_component_lists(component_lists)
-                            st.success(f"Deleted '{item}' from {component_name} list")
-                            st.experimental_rerun()
+                    st.session_state["component_lists_dirty"] = True
+                    st.toast(f"Updated {component_name} list")
+                    # The form above still shows the old rows, so redraw
+                    # once the change has been saved
+                    needs_rerun = True
+    
+    # Flush all pending edits from this run with a single write
+    if st.session_state["component_lists_dirty"]:
+        utils.save_component_lists(component_lists)
+        st.session_state["component_lists_dirty"] = False
+        st.session_state["component_lists_version"] = utils.get_component_lists_version()
+    
+    if needs_rerun:
+        st.rerun()
 
 if __name__ == "__main__":
     main()
@@ -1,98 +1,603 @@
 import streamlit as st
+import concurrent.futures
+import json
 import os
-import yaml
+import sys
 import datetime
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import altair as alt
+import pyarrow as pa
 import utils
-from utils import load_component_lists
+from typing import Any, Dict, List, Optional, Tuple
 
-def load_all_test_data():
+# Flattened analysis columns as (keys into the nested test data, column,
+# default used when the value is missing)
+TEST_DATA_SCHEMA = (
+    (("test_id",), "test_id", ""),
+    (("date",), "date", ""),
+    (("distance_m",), "distance_m", 0),
+    
+    # Platform
+    (("platform", "calibre"), "calibre", ""),
+    (("platform", "rifle"), "rifle", ""),
+    (("platform", "barrel_length_in"), "barrel_length_in", 0.0),
+    (("platform", "twist_rate"), "twist_rate", ""),
+    
+    # Ammo - Case
+    (("ammo", "case", "brand"), "case_brand", ""),
+    (("ammo", "case", "lot"), "case_lot", ""),
+    (("ammo", "case", "neck_turned"), "neck_turned", ""),
+    (("ammo", "case", "brass_sizing"), "brass_sizing", ""),
+    (("ammo", "case", "bushing_size"), "bushing_size", 0.0),
+    (("ammo", "case", "shoulder_bump"), "shoulder_bump", 0.0),
+    
+    # Ammo - Bullet
+    (("ammo", "bullet", "brand"), "bullet_brand", ""),
+    (("ammo", "bullet", "model"), "bullet_model", ""),
+    (("ammo", "bullet", "weight_gr"), "bullet_weight_gr", 0.0),
+    (("ammo", "bullet", "lot"), "bullet_lot", ""),
+    
+    # Ammo - Powder
+    (("ammo", "powder", "brand"), "powder_brand", ""),
+    (("ammo", "powder", "model"), "powder_model", ""),
+    (("ammo", "powder", "charge_gr"), "powder_charge_gr", 0.0),
+    (("ammo", "powder", "lot"), "powder_lot", ""),
+    
+    # Ammo - Primer
+    (("ammo", "primer", "brand"), "primer_brand", ""),
+    (("ammo", "primer", "model"), "primer_model", ""),
+    (("ammo", "primer", "lot"), "primer_lot", ""),
+    
+    # Ammo - Cartridge Measurements
+    (("ammo", "coal_in"), "coal_in", 0.0),
+    (("ammo", "b2o_in"), "b2o_in", 0.0),
+    
+    # Environment
+    (("environment", "temperature_c"), "temperature_c", 0.0),
+    (("environment", "humidity_percent"), "humidity_percent", 0),
+    (("environment", "pressure_hpa"), "pressure_hpa", 0),
+    (("environment", "wind_speed_mps"), "wind_speed_mps", 0.0),
+    (("environment", "wind_dir_deg"), "wind_dir_deg", 0),
+    (("environment", "weather"), "weather", ""),
+    
+    # Group
+    (("group", "shots"), "shots", 0),
+    (("group", "group_es_mm"), "group_es_mm", 0.0),
+    (("group", "group_es_moa"), "group_es_moa", 0.0),
+    (("group", "group_es_x_mm"), "group_es_x_mm", 0.0),
+    (("group", "group_es_y_mm"), "group_es_y_mm", 0.0),
+    (("group", "mean_radius_mm"), "mean_radius_mm", 0.0),
+    (("group", "poi_x_mm"), "poi_x_mm", 0.0),
+    (("group", "poi_y_mm"), "poi_y_mm", 0.0),
+    
+    # Chrono
+    (("chrono", "avg_velocity_fps"), "avg_velocity_fps", 0.0),
+    (("chrono", "sd_fps"), "sd_fps", 0.0),
+    (("chrono", "es_fps"), "es_fps", 0.0),
+    
+    # Notes
+    (("notes",), "notes", ""),
+)
+TEST_DATA_COLUMNS = [column for _, column, _ in TEST_DATA_SCHEMA]
+
+# Flattened rows of all tests, refreshed from the YAML files as they change
+TEST_DATA_CACHE_PATH = os.path.join("tests", "_cache.parquet")
+# YAML modification time of each test when its cached row was written
+TEST_DATA_MANIFEST_PATH = os.path.join("tests", "_cache.json")
+
+# Low-cardinality text columns stored as pandas categoricals so option lists
+# and equality filters work on the integer codes and repeated strings are
+# stored once
+CATEGORICAL_COLUMNS = (
+    "calibre",
+    "rifle",
+    "twist_rate",
+    "case_brand",
+    "neck_turned",
+    "brass_sizing",
+    "bullet_brand",
+    "bullet_model",
+    "powder_brand",
+    "powder_model",
+    "primer_brand",
+    "primer_model",
+    "weather",
+)
+
+# Columns filtered with a date picker or a range slider
+RANGE_COLUMNS = (
+    "date",
+    "distance_m",
+    "temperature_c",
+    "wind_speed_mps",
+    "group_es_mm",
+    "avg_velocity_fps",
+)
+
+# Free-text columns, stored as Arrow-backed strings rather than Python objects
+TEXT_COLUMNS = (
+    "test_id",
+    "case_lot",
+    "bullet_lot",
+    "powder_lot",
+    "primer_lot",
+    "notes",
+)
+TEXT_DTYPE = pd.StringDtype("pyarrow")
+
+# Columns drawn in the charts
+PLOT_COLUMNS = (
+    "date",
+    "group_es_moa",
+    "mean_radius_mm",
+    "avg_velocity_fps",
+    "es_fps",
+    "sd_fps",
+)
+
+# Columns shown in the results table
+DISPLAY_COLUMNS = (
+    "test_id", "date", "distance_m", "calibre", "rifle", 
+    "bullet_brand", "bullet_model", "bullet_weight_gr", 
+    "powder_brand", "powder_model", "powder_charge_gr",
+    "group_es_mm", "group_es_moa", "avg_velocity_fps"
+)
+
+# Chart lines as (column, legend label, color)
+GROUP_SIZE_SERIES = ("group_es_moa", "Group Size (MOA)", "#1f77b4")
+MEAN_RADIUS_SERIES = ("mean_radius_mm", "Mean Radius (mm)", "#d62728")
+VELOCITY_SERIES = ("avg_velocity_fps", "Avg Velocity (fps)", "#2ca02c")
+ES_SERIES = ("es_fps", "ES (fps)", "#ff7f0e")
+SD_SERIES = ("sd_fps", "SD (fps)", "#9467bd")
+
+# Range slider bounds used when there are no tests to take them from
+RANGE_DEFAULTS = {
+    "distance_m": (0, 1000),
+    "temperature_c": (0.0, 40.0),
+    "wind_speed_mps": (0.0, 10.0),
+    "group_es_mm": (0.0, 200.0),
+    "avg_velocity_fps": (0.0, 3000.0),
+}
+
+# Columns filtered with a selectbox, in the order they appear in the sidebar
+FILTER_COLUMNS = (
+    "calibre",
+    "rifle",
+    "twist_rate",
+    "case_brand",
+    "bullet_brand",
+    "bullet_model",
+    "bullet_weight_gr",
+    "powder_brand",
+    "powder_model",
+    "primer_brand",
+    "primer_model",
+    "weather",
+)
+
+# Columns the analysis page works with, in TEST_DATA_COLUMNS order
+ANALYSIS_COLUMNS = [
+    column for column in TEST_DATA_COLUMNS
+    if column in DISPLAY_COLUMNS + RANGE_COLUMNS + FILTER_COLUMNS + PLOT_COLUMNS
+]
+
+def test_data_signature() -> Tuple[Tuple[str, int], ...]:
+    """
+    Build a cheap signature of the tests directory for cache invalidation.
+    
+    Returns:
+        Sorted tuple of (test_id, modification time in ns of its YAML file)
+    """
+    signature = []
+    for test_id in utils.get_test_folders():
+        try:
+            mtime = os.stat(utils.get_test_file_path(test_id)).st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+        signature.append((test_id, mtime))
+    return tuple(sorted(signature))
+
+def read_test_data(test_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the raw data for one test, logging and skipping unreadable files.
+    
+    Args:
+        test_id: Test folder name
+        
+    Returns:
+        Dictionary containing the test data, or None if it could not be read
+    """
+    try:
+        return utils.get_test_data(test_id)
+    except Exception as e:
+        print(f"Error loading test data for {test_id}: {e}")
+        return None
+
+def load_all_test_data(signature: Optional[Tuple[Tuple[str, int], ...]] = None):
     """
     Load all test data from the tests directory into a pandas DataFrame.
     
+    The DataFrame is cached and only rebuilt when a test is added, removed
+    or modified.
+    
+    Args:
+        signature: Result of test_data_signature(), computed if not given
+        
+    Returns:
+        DataFrame containing all test data, sorted by date
+    """
+    if signature is None:
+        signature = test_data_signature()
+    return _load_all_test_data_cached(signature)
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_analysis_data(signature: Tuple[Tuple[str, int], ...]) -> pd.DataFrame:
+    """
+    Load the ANALYSIS_COLUMNS of all tests.
+    
+    The DataFrame is shared by every session rather than copied out of the
+    cache on each call, so callers must treat it as read-only. Only the
+    latest signature is kept, as older ones are never asked for again.
+    Use load_all_test_data() for the full set of columns.
+    
+    Args:
+        signature: Result of test_data_signature(), used as the cache key
+        
+    Returns:
+        DataFrame containing the analysis columns of all tests, sorted by date
+    """
+    return load_all_test_data(signature)[ANALYSIS_COLUMNS]
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def test_count(signature: Tuple[Tuple[str, int], ...]) -> int:
+    """
+    Count the tests that loaded successfully.
+    
+    Args:
+        signature: Result of test_data_signature(), used as the cache key
+        
+    Returns:
+        Number of rows in load_analysis_data(signature)
+    """
+    return len(load_analysis_data(signature))
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def filter_options(signature: Tuple[Tuple[str, int], ...]) -> Dict[str, List[Any]]:
+    """
+    Build the selectbox options for each of the FILTER_COLUMNS.
+    
+    Args:
+        signature: Result of test_data_signature(), used as the cache key
+        
+    Returns:
+        Dictionary mapping each column to "All" followed by its sorted values
+    """
+    df = load_analysis_data(signature)
+    options = {}
+    for column in FILTER_COLUMNS:
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Categories are sorted when the column is converted
+            options[column] = ["All"] + values.cat.categories.tolist()
+        else:
+            options[column] = ["All"] + sorted(values.dropna().unique().tolist())
+    return options
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def filter_bounds(signature: Tuple[Tuple[str, int], ...]) -> Dict[str, Any]:
+    """
+    Compute the bounds of the date picker and range sliders in one pass.
+    
+    Args:
+        signature: Result of test_data_signature(), used as the cache key
+        
+    Returns:
+        Dictionary mapping each of the RANGE_COLUMNS to a (min, max) tuple.
+        Slider bounds fall back to RANGE_DEFAULTS and have the same Python
+        type; the date bounds are datetime.date values, or None if no test
+        has a valid date.
+    """
+    df = load_analysis_data(signature)
+    if df.empty:
+        return {"date": None, **RANGE_DEFAULTS}
+    
+    stats = df[list(RANGE_COLUMNS)].agg(["min", "max"])
+    min_date, max_date = stats["date"]
+    bounds = {"date": (min_date.date(), max_date.date()) if pd.notna(min_date) else None}
+    for column, (default_low, _) in RANGE_DEFAULTS.items():
+        # Cast to the default's type, as the sliders reject NumPy scalars
+        cast = type(default_low)
+        bounds[column] = (cast(stats.loc["min", column]), cast(stats.loc["max", column]))
+    return bounds
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def filter_bitmaps(signature: Tuple[Tuple[str, int], ...]) -> Dict[str, Dict[Any, np.ndarray]]:
+    """
+    Precompute the row mask of every selectbox option.
+    
+    Args:
+        signature: Result of test_data_signature(), used as the cache key
+        
+    Returns:
+        Dictionary mapping each of the FILTER_COLUMNS to a dictionary of
+        option value to boolean array, True for the rows with that value
+    """
+    df = load_analysis_data(signature)
+    options = filter_options(signature)
+    return {
+        column: {value: equals_mask(df[column], value) for value in options[column][1:]}
+        for column in FILTER_COLUMNS
+    }
+
+def extract_value(data: Dict[str, Any], keys: Tuple[str, ...], default: Any) -> Any:
+    """
+    Look up a value in nested test data.
+    
+    Args:
+        data: Dictionary containing the test data
+        keys: Keys to follow from the top level down
+        default: Value returned when any key is missing or the value is null
+        
+    Returns:
+        The value at keys, or default
+    """
+    value = data
+    for key in keys:
+        value = value.get(key) if isinstance(value, dict) else None
+        if value is None:
+            return default
+    return value
+
+def flatten_test_data(test_ids: List[str]) -> pd.DataFrame:
+    """
+    Read and flatten the given tests into analysis columns.
+    
+    Args:
+        test_ids: Test folder names to read
+        
+    Returns:
+        DataFrame with one row per readable test and TEST_DATA_COLUMNS columns
+    """
+    # Overlap the file reads in a thread pool, unless there is only one
+    # worker's worth of tests, such as a single changed test after an edit
+    max_workers = min(16, (os.cpu_count() or 1) * 2, len(test_ids))
+    if max_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(read_test_data, test_ids))
+    else:
+        results = [read_test_data(test_id) for test_id in test_ids]
+    
+    loaded_ids = []
+    raw_data = []
+    for test_id, data in zip(test_ids, results):
+        if data:
+            loaded_ids.append(test_id)
+            raw_data.append(data)
+    
+    if not raw_data:
+        # Type the empty columns from their defaults, as untyped empty columns
+        # would turn the numeric columns of any frame they are joined with
+        # into object columns
+        return pd.DataFrame({
+            column: pd.Series([], dtype=type(default) if default != "" else object)
+            for _, column, default in TEST_DATA_SCHEMA
+        })
+    
+    # Build the frame column by column straight from the schema, so no
+    # per-test row objects are created
+    columns = {
+        column: [extract_value(data, keys, default) for data in raw_data]
+        for keys, column, default in TEST_DATA_SCHEMA
+    }
+    columns["test_id"] = loaded_ids
+    # Each test's YAML yields its own copy of values like the calibre, so
+    # intern them to share one object per distinct value and let equality
+    # checks while building the categories short-circuit on identity
+    for column in CATEGORICAL_COLUMNS:
+        columns[column] = [
+            sys.intern(value) if type(value) is str else value
+            for value in columns[column]
+        ]
+    return pd.DataFrame(columns)
+
+def set_test_data_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the columns of a flattened test frame to their analysis dtypes.
+    
+    Dates are parsed to datetime64, the CATEGORICAL_COLUMNS become ordered
+    categoricals with sorted categories, the TEXT_COLUMNS become Arrow-backed
+    strings and integer columns are downcast to the smallest integer type
+    that holds their values. Columns that already have the right dtype are
+    left as is.
+    
+    Args:
+        df: Flattened test data
+        
+    Returns:
+        The same DataFrame with converted columns
+    """
+    if not pd.api.types.is_datetime64_any_dtype(df["date"]):
+        df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce")
+    for column in CATEGORICAL_COLUMNS:
+        if not isinstance(df[column].dtype, pd.CategoricalDtype):
+            categories = sorted(df[column].dropna().unique())
+            df[column] = df[column].astype(pd.CategoricalDtype(categories, ordered=True))
+    for column in TEXT_COLUMNS:
+        if df[column].dtype != TEXT_DTYPE:
+            df[column] = df[column].astype(TEXT_DTYPE)
+    for column in df.select_dtypes("integer").columns:
+        df[column] = pd.to_numeric(df[column], downcast="integer")
+    return df
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _load_all_test_data_cached(signature: Tuple[Tuple[str, int], ...]):
+    """
+    Load and flatten the tests listed in a directory signature.
+    
+    Rows are kept in an on-disk Parquet cache alongside a manifest of the
+    YAML modification times they were built from, so only tests whose YAML
+    file changed since the cache was written are parsed again.
+    
+    Args:
+        signature: Result of test_data_signature(), used as the cache key
+        
     Returns:
-        DataFrame containing all test data
+        DataFrame containing all test data, sorted by date
     """
-    test_folders = utils.get_test_folders()
-    all_data = []
+    cached = None
+    manifest = {}
+    if os.path.exists(TEST_DATA_CACHE_PATH) and os.path.exists(TEST_DATA_MANIFEST_PATH):
+        try:
+            with open(TEST_DATA_MANIFEST_PATH, 'r') as file:
+                manifest = json.load(file)
+            cached = pd.read_parquet(TEST_DATA_CACHE_PATH, memory_map=True)
+        except Exception as e:
+            print(f"Ignoring unreadable test data cache: {e}")
+            cached = None
+    
+    write_cache = True
+    if cached is None:
+        stale = [test_id for test_id, _ in signature]
+        df = flatten_test_data(stale)
+    else:
+        cached_ids = set(cached["test_id"])
+        stale = [test_id for test_id, mtime in signature 
+                 if manifest.get(test_id) != mtime or test_id not in cached_ids]
+        current_ids = {test_id for test_id, _ in signature}
+        keep = cached["test_id"].isin(current_ids) & ~cached["test_id"].isin(stale)
+        if not stale and keep.all():
+            df = cached
+            write_cache = False
+        elif stale:
+            # Concatenating categoricals with different categories falls back
+            # to object dtype, so the dtypes are set again below
+            df = pd.concat([cached[keep], flatten_test_data(stale)], ignore_index=True)
+        else:
+            # Tests were only removed, so the cached rows keep their dtypes
+            df = cached[keep].reset_index(drop=True)
     
-    for test_id in test_folders:
+    df = set_test_data_dtypes(df)
+    # Keep rows in date order so filtered slices can be plotted without
+    # sorting them again
+    df = df.sort_values(["date", "test_id"], ignore_index=True)
+    
+    if write_cache:
+        # The manifest is written last, so an interrupted write can only
+        # make rows look stale, never current
         try:
-            data = utils.get_test_data(test_id)
-            if data:
-                # Flatten the nested structure for easier filtering
-                flat_data = {
-                    "test_id": test_id,
-                    "date": data.get("date", ""),
-                    "distance_m": data.get("distance_m", 0),
-                    
-                    # Platform
-                    "calibre": data.get("platform", {}).get("calibre", ""),
-                    "rifle": data.get("platform", {}).get("rifle", ""),
-                    "barrel_length_in": data.get("platform", {}).get("barrel_length_in", 0.0),
-                    "twist_rate": data.get("platform", {}).get("twist_rate", ""),
-                    
-                    # Ammo - Case
-                    "case_brand": data.get("ammo", {}).get("case", {}).get("brand", ""),
-                    "case_lot": data.get("ammo", {}).get("case", {}).get("lot", ""),
-                    "neck_turned": data.get("ammo", {}).get("case", {}).get("neck_turned", ""),
-                    "brass_sizing": data.get("ammo", {}).get("case", {}).get("brass_sizing", ""),
-                    "bushing_size": data.get("ammo", {}).get("case", {}).get("bushing_size", 0.0),
-                    "shoulder_bump": data.get("ammo", {}).get("case", {}).get("shoulder_bump", 0.0),
-                    
-                    # Ammo - Bullet
-                    "bullet_brand": data.get("ammo", {}).get("bullet", {}).get("brand", ""),
-                    "bullet_model": data.get("ammo", {}).get("bullet", {}).get("model", ""),
-                    "bullet_weight_gr": data.get("ammo", {}).get("bullet", {}).get("weight_gr", 0.0),
-                    "bullet_lot": data.get("ammo", {}).get("bullet", {}).get("lot", ""),
-                    
-                    # Ammo - Powder
-                    "powder_brand": data.get("ammo", {}).get("powder", {}).get("brand", ""),
-                    "powder_model": data.get("ammo", {}).get("powder", {}).get("model", ""),
-                    "powder_charge_gr": data.get("ammo", {}).get("powder", {}).get("charge_gr", 0.0),
-                    "powder_lot": data.get("ammo", {}).get("powder", {}).get("lot", ""),
-                    
-                    # Ammo - Primer
-                    "primer_brand": data.get("ammo", {}).get("primer", {}).get("brand", ""),
-                    "primer_model": data.get("ammo", {}).get("primer", {}).get("model", ""),
-                    "primer_lot": data.get("ammo", {}).get("primer", {}).get("lot", ""),
-                    
-                    # Ammo - Cartridge Measurements
-                    "coal_in": data.get("ammo", {}).get("coal_in", 0.0),
-                    "b2o_in": data.get("ammo", {}).get("b2o_in", 0.0),
-                    
-                    # Environment
-                    "temperature_c": data.get("environment", {}).get("temperature_c", 0.0),
-                    "humidity_percent": data.get("environment", {}).get("humidity_percent", 0),
-                    "pressure_hpa": data.get("environment", {}).get("pressure_hpa", 0),
-                    "wind_speed_mps": data.get("environment", {}).get("wind_speed_mps", 0.0),
-                    "wind_dir_deg": data.get("environment", {}).get("wind_dir_deg", 0),
-                    "weather": data.get("environment", {}).get("weather", ""),
-                    
-                    # Group
-                    "shots": data.get("group", {}).get("shots", 0),
-                    "group_es_mm": data.get("group", {}).get("group_es_mm", 0.0),
-                    "group_es_moa": data.get("group", {}).get("group_es_moa", 0.0),
-                    "group_es_x_mm": data.get("group", {}).get("group_es_x_mm", 0.0),
-                    "group_es_y_mm": data.get("group", {}).get("group_es_y_mm", 0.0),
-                    "mean_radius_mm": data.get("group", {}).get("mean_radius_mm", 0.0),
-                    "poi_x_mm": data.get("group", {}).get("poi_x_mm", 0.0),
-                    "poi_y_mm": data.get("group", {}).get("poi_y_mm", 0.0),
-                    
-                    # Chrono
-                    "avg_velocity_fps": data.get("chrono", {}).get("avg_velocity_fps", 0.0),
-                    "sd_fps": data.get("chrono", {}).get("sd_fps", 0.0),
-                    "es_fps": data.get("chrono", {}).get("es_fps", 0.0),
-                    
-                    # Notes
-                    "notes": data.get("notes", "")
-                }
-                all_data.append(flat_data)
+            df.to_parquet(TEST_DATA_CACHE_PATH, compression="zstd", index=False)
+            with open(TEST_DATA_MANIFEST_PATH, 'w') as file:
+                json.dump(dict(signature), file)
         except Exception as e:
-            print(f"Error loading test data for {test_id}: {e}")
+            print(f"Could not write test data cache: {e}")
+    
+    return df
+
+def and_between(mask: np.ndarray, values: pd.Series, low: Any, high: Any) -> None:
+    """
+    Narrow a row mask to the values of a column within an inclusive range.
+    
+    Both comparisons are written into one scratch array and ANDed into mask
+    in place, so no temporary arrays are allocated per comparison.
+    
+    Args:
+        mask: Boolean row mask, updated in place
+        values: Numeric or datetime64 column
+        low: Lowest value to include
+        high: Highest value to include
+    """
+    arr = values.to_numpy(copy=False)
+    scratch = np.empty(len(arr), dtype=bool)
+    np.greater_equal(arr, low, out=scratch)
+    mask &= scratch
+    np.less_equal(arr, high, out=scratch)
+    mask &= scratch
+
+def equals_mask(values: pd.Series, value: Any) -> np.ndarray:
+    """
+    Compare a column against a single value on its underlying array.
+    
+    Categorical columns are compared on their integer codes.
+    
+    Args:
+        values: Column to compare
+        value: Value to match
+        
+    Returns:
+        Boolean array, True where the column equals value
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        if value not in categories:
+            return np.zeros(len(values), dtype=bool)
+        return values.cat.codes.to_numpy(copy=False) == categories.get_loc(value)
+    return values.to_numpy(copy=False) == value
+
+def multi_axis_chart(
+    plot_df: pd.DataFrame,
+    axes: Tuple[Tuple[str, Tuple[Tuple[str, str, str], ...]], ...],
+    title: str,
+) -> alt.LayerChart:
+    """
+    Build a line chart over time with an independent y-axis per series group.
+    
+    The first axis is drawn on the left and the others on the right, each
+    further right axis offset outward so they do not overlap.
+    
+    Args:
+        plot_df: Filtered tests sorted by date, restricted to PLOT_COLUMNS
+        axes: (axis title, series) for each axis, where series holds
+            (column, label, color) for each line drawn against that axis
+        title: Chart title
+        
+    Returns:
+        Layered Altair chart, rendered by the browser
+    """
+    series = [line for _, lines in axes for line in lines]
+    labels = {column: label for column, label, _ in series}
+    long_df = plot_df.melt(
+        id_vars="date",
+        value_vars=list(labels),
+        var_name="metric",
+        value_name="value",
+    )
+    long_df["metric"] = long_df["metric"].map(labels)
+    
+    # One shared color scale gives a single legend across all axes
+    color = alt.Color(
+        "metric:N",
+        title=None,
+        scale=alt.Scale(
+            domain=[label for _, label, _ in series],
+            range=[line_color for _, _, line_color in series],
+        ),
+        legend=alt.Legend(orient="top-left"),
+    )
     
-    return pd.DataFrame(all_data)
+    layers = []
+    for i, (axis_title, lines) in enumerate(axes):
+        # Color the axis title like its line when it only has one series
+        title_color = lines[0][2] if len(lines) == 1 else alt.Undefined
+        axis = alt.Axis(
+            orient="left" if i == 0 else "right",
+            offset=60 * (i - 1) if i > 1 else 0,
+            titleColor=title_color,
+        )
+        layers.append(alt.Chart(long_df).transform_filter(
+            alt.FieldOneOfPredicate(field="metric", oneOf=[label for _, label, _ in lines])
+        ).mark_line(point=True).encode(
+            x=alt.X("date:T", title="Date"),
+            y=alt.Y("value:Q", title=axis_title, scale=alt.Scale(zero=False), axis=axis),
+            color=color,
+            tooltip=[
+                alt.Tooltip("date:T", title="Date"),
+                alt.Tooltip("metric:N", title="Metric"),
+                alt.Tooltip("value:Q", title="Value"),
+            ],
+        ))
+    
+    return alt.layer(*layers).resolve_scale(y="independent").properties(title=title, height=400)
 
 def main():
     st.set_page_config(
@@ -107,265 +612,224 @@ def main():
     
     # Add a link back to the main app
     st.sidebar.markdown("### Navigation")
-    if st.sidebar.button("Back to Main App"):
-        import webbrowser
-        webbrowser.open("http://localhost:8501")
-    
-    # Load component lists for dropdown menus
-    component_lists = load_component_lists()
+    st.sidebar.link_button("Back to Main App", "http://localhost:8501")
     
     # Load all test data
+    # The widgets are built from small per-signature summaries, so the
+    # DataFrame itself is only copied out of the cache when the filters
+    # have to be applied again
+    signature = test_data_signature()
     with st.spinner("Loading test data..."):
-        df = load_all_test_data()
+        options = filter_options(signature)
+        bounds = filter_bounds(signature)
     
     # Display the number of tests loaded
-    st.sidebar.markdown(f"### {len(df)} Tests Loaded")
+    st.sidebar.markdown(f"### {test_count(signature)} Tests Loaded")
     
     # Create filter section
     st.header("Filter Tests")
-    st.markdown("Select filter criteria to narrow down the tests. Leave a filter empty to include all values.")
-    
-    # Create filter UI with multiple columns for better space usage
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.subheader("Test Info")
-        
-        # Date range filter
-        min_date = df["date"].min() if not df.empty else datetime.date.today().isoformat()
-        max_date = df["date"].max() if not df.empty else datetime.date.today().isoformat()
-        
-        date_range = st.date_input(
-            "Date Range",
-            value=(
-                datetime.date.fromisoformat(min_date) if isinstance(min_date, str) else datetime.date.today(),
-                datetime.date.fromisoformat(max_date) if isinstance(max_date, str) else datetime.date.today()
-            ),
-            key="date_range"
-        )
-        
-        # Distance range filter
-        distance_range = st.slider(
-            "Distance Range (m)",
-            min_value=int(df["distance_m"].min()) if not df.empty else 0,
-            max_value=int(df["distance_m"].max()) if not df.empty else 1000,
-            value=(int(df["distance_m"].min()) if not df.empty else 0, 
-                   int(df["distance_m"].max()) if not df.empty else 1000),
-            step=100
-        )
-        
-        st.subheader("Platform")
-        
-        # Calibre filter
-        calibre_options = ["All"] + sorted(df["calibre"].unique().tolist())
-        selected_calibre = st.selectbox("Calibre", options=calibre_options)
-        
-        # Rifle filter
-        rifle_options = ["All"] + sorted(df["rifle"].unique().tolist())
-        selected_rifle = st.selectbox("Rifle", options=rifle_options)
-        
-        # Twist rate filter
-        twist_rate_options = ["All"] + sorted(df["twist_rate"].unique().tolist())
-        selected_twist_rate = st.selectbox("Twist Rate", options=twist_rate_options)
+    st.markdown("Select filter criteria to narrow down the tests and click **Apply filters**. Leave a filter empty to include all values.")
     
-    with col2:
-        st.subheader("Ammunition")
+    # Filter widgets only take effect when the form is submitted, so
+    # adjusting several of them does not rerun the page each time
+    with st.form("filters"):
+        # Create filter UI with multiple columns for better space usage
+        col1, col2, col3 = st.columns(3)
         
-        # Case brand filter
-        case_brand_options = ["All"] + sorted(df["case_brand"].unique().tolist())
-        selected_case_brand = st.selectbox("Case Brand", options=case_brand_options)
-        
-        # Bullet brand filter
-        bullet_brand_options = ["All"] + sorted(df["bullet_brand"].unique().tolist())
-        selected_bullet_brand = st.selectbox("Bullet Brand", options=bullet_brand_options)
-        
-        # Bullet model filter
-        bullet_model_options = ["All"] + sorted(df["bullet_model"].unique().tolist())
-        selected_bullet_model = st.selectbox("Bullet Model", options=bullet_model_options)
-        
-        # Bullet weight filter
-        bullet_weight_options = ["All"] + sorted(df["bullet_weight_gr"].unique().tolist())
-        selected_bullet_weight = st.selectbox("Bullet Weight (gr)", options=bullet_weight_options)
-        
-        # Powder brand filter
-        powder_brand_options = ["All"] + sorted(df["powder_brand"].unique().tolist())
-        selected_powder_brand = st.selectbox("Powder Brand", options=powder_brand_options)
-        
-        # Powder model filter
-        powder_model_options = ["All"] + sorted(df["powder_model"].unique().tolist())
-        selected_powder_model = st.selectbox("Powder Model", options=powder_model_options)
+        with col1:
+            st.subheader("Test Info")
+            
+            # Date range filter
+            date_range = st.date_input(
+                "Date Range",
+                value=bounds["date"] or (datetime.date.today(), datetime.date.today()),
+                key="date_range"
+            )
+            
+            # Distance range filter
+            distance_range = st.slider(
+                "Distance Range (m)",
+                min_value=bounds["distance_m"][0],
+                max_value=bounds["distance_m"][1],
+                value=bounds["distance_m"],
+                step=100
+            )
+            
+            st.subheader("Platform")
+            
+            # Calibre filter
+            calibre_options = options["calibre"]
+            selected_calibre = st.selectbox("Calibre", options=calibre_options)
+            
+            # Rifle filter
+            rifle_options = options["rifle"]
+            selected_rifle = st.selectbox("Rifle", options=rifle_options)
+            
+            # Twist rate filter
+            twist_rate_options = options["twist_rate"]
+            selected_twist_rate = st.selectbox("Twist Rate", options=twist_rate_options)
         
-        # Primer brand filter
-        primer_brand_options = ["All"] + sorted(df["primer_brand"].unique().tolist())
-        selected_primer_brand = st.selectbox("Primer Brand", options=primer_brand_options)
+        with col2:
+            st.subheader("Ammunition")
+            
+            # Case brand filter
+            case_brand_options = options["case_brand"]
+            selected_case_brand = st.selectbox("Case Brand", options=case_brand_options)
+            
+            # Bullet brand filter
+            bullet_brand_options = options["bullet_brand"]
+            selected_bullet_brand = st.selectbox("Bullet Brand", options=bullet_brand_options)
+            
+            # Bullet model filter
+            bullet_model_options = options["bullet_model"]
+            selected_bullet_model = st.selectbox("Bullet Model", options=bullet_model_options)
+            
+            # Bullet weight filter
+            bullet_weight_options = options["bullet_weight_gr"]
+            selected_bullet_weight = st.selectbox("Bullet Weight (gr)", options=bullet_weight_options)
+            
+            # Powder brand filter
+            powder_brand_options = options["powder_brand"]
+            selected_powder_brand = st.selectbox("Powder Brand", options=powder_brand_options)
+            
+            # Powder model filter
+            powder_model_options = options["powder_model"]
+            selected_powder_model = st.selectbox("Powder Model", options=powder_model_options)
+            
+            # Primer brand filter
+            primer_brand_options = options["primer_brand"]
+            selected_primer_brand = st.selectbox("Primer Brand", options=primer_brand_options)
+            
+            # Primer model filter
+            primer_model_options = options["primer_model"]
+            selected_primer_model = st.selectbox("Primer Model", options=primer_model_options)
         
-        # Primer model filter
-        primer_model_options = ["All"] + sorted(df["primer_model"].unique().tolist())
-        selected_primer_model = st.selectbox("Primer Model", options=primer_model_options)
-    
-    with col3:
-        st.subheader("Environment")
+        with col3:
+            st.subheader("Environment")
+            
+            # Temperature range filter
+            temp_range = st.slider(
+                "Temperature Range (°C)",
+                min_value=bounds["temperature_c"][0],
+                max_value=bounds["temperature_c"][1],
+                value=bounds["temperature_c"],
+                step=1.0
+            )
+            
+            # Wind speed range filter
+            wind_range = st.slider(
+                "Wind Speed Range (m/s)",
+                min_value=bounds["wind_speed_mps"][0],
+                max_value=bounds["wind_speed_mps"][1],
+                value=bounds["wind_speed_mps"],
+                step=1.0
+            )
+            
+            # Weather filter
+            weather_options = options["weather"]
+            selected_weather = st.selectbox("Weather", options=weather_options)
+            
+            st.subheader("Results")
+            
+            # Group size range filter
+            group_es_range = st.slider(
+                "Group Size Range (mm)",
+                min_value=bounds["group_es_mm"][0],
+                max_value=bounds["group_es_mm"][1],
+                value=bounds["group_es_mm"],
+                step=10.0
+            )
+            
+            # Velocity range filter
+            velocity_range = st.slider(
+                "Velocity Range (fps)",
+                min_value=bounds["avg_velocity_fps"][0],
+                max_value=bounds["avg_velocity_fps"][1],
+                value=bounds["avg_velocity_fps"],
+                step=100.0
+            )
         
-        # Temperature range filter
-        temp_range = st.slider(
-            "Temperature Range (°C)",
-            min_value=float(df["temperature_c"].min()) if not df.empty else 0.0,
-            max_value=float(df["temperature_c"].max()) if not df.empty else 40.0,
-            value=(float(df["temperature_c"].min()) if not df.empty else 0.0, 
-                   float(df["temperature_c"].max()) if not df.empty else 40.0),
-            step=1.0
-        )
+        submitted = st.form_submit_button("Apply filters")
+    
+    # Reuse the last filtered result until the filters are applied again or
+    # the tests change
+    last_filtered = st.session_state.get("analysis_filtered")
+    if submitted or last_filtered is None or last_filtered[0] != signature:
+        df = load_analysis_data(signature)
+        bitmaps = filter_bitmaps(signature)
         
-        # Wind speed range filter
-        wind_range = st.slider(
-            "Wind Speed Range (m/s)",
-            min_value=float(df["wind_speed_mps"].min()) if not df.empty else 0.0,
-            max_value=float(df["wind_speed_mps"].max()) if not df.empty else 10.0,
-            value=(float(df["wind_speed_mps"].min()) if not df.empty else 0.0, 
-                   float(df["wind_speed_mps"].max()) if not df.empty else 10.0),
-            step=1.0
-        )
+        # Apply filters as one combined boolean mask so the DataFrame is only
+        # sliced once
+        mask = np.ones(len(df), dtype=bool)
         
-        # Weather filter
-        weather_options = ["All"] + sorted(df["weather"].unique().tolist())
-        selected_weather = st.selectbox("Weather", options=weather_options)
+        # Date filter
+        if len(date_range) == 2:
+            start_date, end_date = date_range
+            and_between(mask, df["date"], np.datetime64(start_date), np.datetime64(end_date))
         
-        st.subheader("Results")
+        # Range filters, skipped when the range still spans every test
+        for column, (low, high) in (
+            ("distance_m", distance_range),
+            ("temperature_c", temp_range),
+            ("wind_speed_mps", wind_range),
+            ("group_es_mm", group_es_range),
+            ("avg_velocity_fps", velocity_range),
+        ):
+            column_min, column_max = bounds[column]
+            if low > column_min or high < column_max:
+                and_between(mask, df[column], low, high)
         
-        # Group size range filter
-        group_es_range = st.slider(
-            "Group Size Range (mm)",
-            min_value=float(df["group_es_mm"].min()) if not df.empty else 0.0,
-            max_value=float(df["group_es_mm"].max()) if not df.empty else 200.0,
-            value=(float(df["group_es_mm"].min()) if not df.empty else 0.0, 
-                   float(df["group_es_mm"].max()) if not df.empty else 200.0),
-            step=10.0
-        )
+        # Selection filters, skipped when set to "All", use the precomputed
+        # row mask of the selected value
+        for column, selected in (
+            ("calibre", selected_calibre),
+            ("rifle", selected_rifle),
+            ("twist_rate", selected_twist_rate),
+            ("case_brand", selected_case_brand),
+            ("bullet_brand", selected_bullet_brand),
+            ("bullet_model", selected_bullet_model),
+            ("bullet_weight_gr", selected_bullet_weight),
+            ("powder_brand", selected_powder_brand),
+            ("powder_model", selected_powder_model),
+            ("primer_brand", selected_primer_brand),
+            ("primer_model", selected_primer_model),
+            ("weather", selected_weather),
+        ):
+            if selected != "All":
+                mask &= bitmaps[column][selected]
         
-        # Velocity range filter
-        velocity_range = st.slider(
-            "Velocity Range (fps)",
-            min_value=float(df["avg_velocity_fps"].min()) if not df.empty else 0.0,
-            max_value=float(df["avg_velocity_fps"].max()) if not df.empty else 3000.0,
-            value=(float(df["avg_velocity_fps"].min()) if not df.empty else 0.0, 
-                   float(df["avg_velocity_fps"].max()) if not df.empty else 3000.0),
-            step=100.0
-        )
-    
-    # Apply filters
-    filtered_df = df.copy()
-    
-    # Date filter
-    if len(date_range) == 2:
-        start_date, end_date = date_range
-        filtered_df = filtered_df[
-            (filtered_df["date"] >= start_date.isoformat()) & 
-            (filtered_df["date"] <= end_date.isoformat())
-        ]
-    
-    # Distance filter
-    filtered_df = filtered_df[
-        (filtered_df["distance_m"] >= distance_range[0]) & 
-        (filtered_df["distance_m"] <= distance_range[1])
-    ]
-    
-    # Calibre filter
-    if selected_calibre != "All":
-        filtered_df = filtered_df[filtered_df["calibre"] == selected_calibre]
-    
-    # Rifle filter
-    if selected_rifle != "All":
-        filtered_df = filtered_df[filtered_df["rifle"] == selected_rifle]
-    
-    # Twist rate filter
-    if selected_twist_rate != "All":
-        filtered_df = filtered_df[filtered_df["twist_rate"] == selected_twist_rate]
-    
-    # Case brand filter
-    if selected_case_brand != "All":
-        filtered_df = filtered_df[filtered_df["case_brand"] == selected_case_brand]
-    
-    # Bullet brand filter
-    if selected_bullet_brand != "All":
-        filtered_df = filtered_df[filtered_df["bullet_brand"] == selected_bullet_brand]
-    
-    # Bullet model filter
-    if selected_bullet_model != "All":
-        filtered_df = filtered_df[filtered_df["bullet_model"] == selected_bullet_model]
-    
-    # Bullet weight filter
-    if selected_bullet_weight != "All":
-        filtered_df = filtered_df[filtered_df["bullet_weight_gr"] == selected_bullet_weight]
-    
-    # Powder brand filter
-    if selected_powder_brand != "All":
-        filtered_df = filtered_df[filtered_df["powder_brand"] == selected_powder_brand]
-    
-    # Powder model filter
-    if selected_powder_model != "All":
-        filtered_df = filtered_df[filtered_df["powder_model"] == selected_powder_model]
-    
-    # Primer brand filter
-    if selected_primer_brand != "All":
-        filtered_df = filtered_df[filtered_df["primer_brand"] == selected_primer_brand]
-    
-    # Primer model filter
-    if selected_primer_model != "All":
-        filtered_df = filtered_df[filtered_df["primer_model"] == selected_primer_model]
-    
-    # Temperature filter
-    filtered_df = filtered_df[
-        (filtered_df["temperature_c"] >= temp_range[0]) & 
-        (filtered_df["temperature_c"] <= temp_range[1])
-    ]
-    
-    # Wind speed filter
-    filtered_df = filtered_df[
-        (filtered_df["wind_speed_mps"] >= wind_range[0]) & 
-        (filtered_df["wind_speed_mps"] <= wind_range[1])
-    ]
-    
-    # Weather filter
-    if selected_weather != "All":
-        filtered_df = filtered_df[filtered_df["weather"] == selected_weather]
-    
-    # Group size filter
-    filtered_df = filtered_df[
-        (filtered_df["group_es_mm"] >= group_es_range[0]) & 
-        (filtered_df["group_es_mm"] <= group_es_range[1])
-    ]
-    
-    # Velocity filter
-    filtered_df = filtered_df[
-        (filtered_df["avg_velocity_fps"] >= velocity_range[0]) & 
-        (filtered_df["avg_velocity_fps"] <= velocity_range[1])
-    ]
+        if mask.all():
+            # Nothing is filtered out, so the loaded frame is used as is
+            filtered_df = df
+        else:
+            # Renumber the rows in place rather than copying the slice again
+            filtered_df = df.loc[mask]
+            filtered_df.index = pd.RangeIndex(len(filtered_df))
+        # Convert the table view to Arrow once per result, as Streamlit
+        # sends Arrow tables to the browser without converting them again
+        display_table = pa.Table.from_pandas(filtered_df[list(DISPLAY_COLUMNS)])
+        st.session_state["analysis_filtered"] = (signature, filtered_df, display_table)
+    else:
+        _, filtered_df, display_table = last_filtered
     
     # Display filtered results
     st.header("Filtered Tests")
     st.markdown(f"Found **{len(filtered_df)}** tests matching your criteria.")
     
     if not filtered_df.empty:
-        # Select columns to display
-        display_columns = [
-            "test_id", "date", "distance_m", "calibre", "rifle", 
-            "bullet_brand", "bullet_model", "bullet_weight_gr", 
-            "powder_brand", "powder_model", "powder_charge_gr",
-            "group_es_mm", "group_es_moa", "avg_velocity_fps"
-        ]
-        
         # Display the filtered tests
-        st.dataframe(filtered_df[display_columns], use_container_width=True)
+        st.dataframe(
+            display_table,
+            use_container_width=True,
+            column_config={"date": st.column_config.DateColumn("date", format="YYYY-MM-DD")}
+        )
         
         # Data Visualization
         st.header("Data Visualization")
         
         if len(filtered_df) > 1:
-            # Convert date strings to datetime objects for proper sorting
-            filtered_df['date_obj'] = pd.to_datetime(filtered_df['date'])
-            
-            # Sort by date
-            plot_df = filtered_df.sort_values('date_obj')
+            # Rows are already in date order
+            plot_df = filtered_df[list(PLOT_COLUMNS)]
             
             # Create tabs for different charts
             chart_tabs = st.tabs(["Separate Charts", "Combined Chart"])
@@ -375,37 +839,15 @@ def main():
                 # Accuracy Metrics Chart
                 st.subheader("Group Size and Mean Radius Over Time")
                 
-                # Create the plot
-                fig1, ax1 = plt.subplots(figsize=(12, 6))
-                
-                # Plot group size (MOA) on the left y-axis
-                color = 'tab:blue'
-                ax1.set_xlabel('Date')
-                ax1.set_ylabel('Group Size (MOA)', color=color)
-                ax1.plot(plot_df['date_obj'], plot_df['group_es_moa'], 'o-', color=color, label='Group Size (MOA)')
-                ax1.tick_params(axis='y', labelcolor=color)
-                
-                # Create a second y-axis for mean radius
-                ax2 = ax1.twinx()
-                color = 'tab:red'
-                ax2.set_ylabel('Mean Radius (mm)', color=color)
-                ax2.plot(plot_df['date_obj'], plot_df['mean_radius_mm'], 'o-', color=color, label='Mean Radius (mm)')
-                ax2.tick_params(axis='y', labelcolor=color)
-                
-                # Rotate x-axis labels for better readability
-                plt.xticks(rotation=45)
-                
-                # Add a title and adjust layout
-                plt.title('Group Size and Mean Radius Over Time')
-                fig1.tight_layout()
-                
-                # Add a legend
-                lines1, labels1 = ax1.get_legend_handles_labels()
-                lines2, labels2 = ax2.get_legend_handles_labels()
-                ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
-                
-                # Display the plot
-                st.pyplot(fig1)
+                accuracy_chart = multi_axis_chart(
+                    plot_df,
+                    axes=(
+                        ("Group Size (MOA)", (GROUP_SIZE_SERIES,)),
+                        ("Mean Radius (mm)", (MEAN_RADIUS_SERIES,)),
+                    ),
+                    title="Group Size and Mean Radius Over Time",
+                )
+                st.altair_chart(accuracy_chart, use_container_width=True)
                 
                 # Add explanation
                 st.markdown("""
@@ -420,38 +862,15 @@ def main():
                 # Velocity Metrics Chart
                 st.subheader("Velocity Metrics Over Time")
                 
-                # Create the plot
-                fig2, ax3 = plt.subplots(figsize=(12, 6))
-                
-                # Plot average velocity on the left y-axis
-                color = 'tab:green'
-                ax3.set_xlabel('Date')
-                ax3.set_ylabel('Average Velocity (fps)', color=color)
-                ax3.plot(plot_df['date_obj'], plot_df['avg_velocity_fps'], 'o-', color=color, label='Avg Velocity (fps)')
-                ax3.tick_params(axis='y', labelcolor=color)
-                
-                # Create a second y-axis for ES and SD
-                ax4 = ax3.twinx()
-                ax4.set_ylabel('Velocity Variation (fps)')
-                
-                # Plot ES and SD on the right y-axis with different colors
-                ax4.plot(plot_df['date_obj'], plot_df['es_fps'], 'o-', color='tab:orange', label='ES (fps)')
-                ax4.plot(plot_df['date_obj'], plot_df['sd_fps'], 'o-', color='tab:purple', label='SD (fps)')
-                
-                # Rotate x-axis labels for better readability
-                plt.xticks(rotation=45)
-                
-                # Add a title and adjust layout
-                plt.title('Velocity Metrics Over Time')
-                fig2.tight_layout()
-                
-                # Add a legend
-                lines3, labels3 = ax3.get_legend_handles_labels()
-                lines4, labels4 = ax4.get_legend_handles_labels()
-                ax3.legend(lines3 + lines4, labels3 + labels4, loc='upper left')
-                
-                # Display the plot
-                st.pyplot(fig2)
+                velocity_chart = multi_axis_chart(
+                    plot_df,
+                    axes=(
+                        ("Average Velocity (fps)", (VELOCITY_SERIES,)),
+                        ("Velocity Variation (fps)", (ES_SERIES, SD_SERIES)),
+                    ),
+                    title="Velocity Metrics Over Time",
+                )
+                st.altair_chart(velocity_chart, use_container_width=True)
                 
                 # Add explanation
                 st.markdown("""
@@ -468,76 +887,18 @@ def main():
             with chart_tabs[1]:
                 st.subheader("All Metrics Combined")
                 
-                # Create figure with 5 y-axes
-                fig3, ax5 = plt.subplots(figsize=(14, 8))
-                
-                # Define colors for each metric
-                colors = {
-                    'group_es_moa': 'tab:blue',
-                    'mean_radius_mm': 'tab:red',
-                    'avg_velocity_fps': 'tab:green',
-                    'es_fps': 'tab:orange',
-                    'sd_fps': 'tab:purple'
-                }
-                
-                # First axis - Group Size (MOA)
-                ax5.set_xlabel('Date')
-                ax5.set_ylabel('Group Size (MOA)', color=colors['group_es_moa'])
-                ax5.plot(plot_df['date_obj'], plot_df['group_es_moa'], 'o-', color=colors['group_es_moa'], label='Group Size (MOA)')
-                ax5.tick_params(axis='y', labelcolor=colors['group_es_moa'])
-                
-                # Create additional axes
-                ax6 = ax5.twinx()  # Mean Radius
-                ax7 = ax5.twinx()  # Average Velocity
-                ax8 = ax5.twinx()  # ES
-                ax9 = ax5.twinx()  # SD
-                
-                # Offset the right axes to prevent overlap
-                offset = 60
-                ax7.spines['right'].set_position(('outward', offset))
-                ax8.spines['right'].set_position(('outward', offset * 2))
-                ax9.spines['right'].set_position(('outward', offset * 3))
-                
-                # Mean Radius (mm)
-                ax6.set_ylabel('Mean Radius (mm)', color=colors['mean_radius_mm'])
-                ax6.plot(plot_df['date_obj'], plot_df['mean_radius_mm'], 'o-', color=colors['mean_radius_mm'], label='Mean Radius (mm)')
-                ax6.tick_params(axis='y', labelcolor=colors['mean_radius_mm'])
-                
-                # Average Velocity (fps)
-                ax7.set_ylabel('Avg Velocity (fps)', color=colors['avg_velocity_fps'])
-                ax7.plot(plot_df['date_obj'], plot_df['avg_velocity_fps'], 'o-', color=colors['avg_velocity_fps'], label='Avg Velocity (fps)')
-                ax7.tick_params(axis='y', labelcolor=colors['avg_velocity_fps'])
-                
-                # ES (fps)
-                ax8.set_ylabel('ES (fps)', color=colors['es_fps'])
-                ax8.plot(plot_df['date_obj'], plot_df['es_fps'], 'o-', color=colors['es_fps'], label='ES (fps)')
-                ax8.tick_params(axis='y', labelcolor=colors['es_fps'])
-                
-                # SD (fps)
-                ax9.set_ylabel('SD (fps)', color=colors['sd_fps'])
-                ax9.plot(plot_df['date_obj'], plot_df['sd_fps'], 'o-', color=colors['sd_fps'], label='SD (fps)')
-                ax9.tick_params(axis='y', labelcolor=colors['sd_fps'])
-                
-                # Rotate x-axis labels for better readability
-                plt.xticks(rotation=45)
-                
-                # Add a title and adjust layout
-                plt.title('All Metrics Combined')
-                fig3.tight_layout()
-                
-                # Create a combined legend
-                lines = []
-                labels = []
-                for ax in [ax5, ax6, ax7, ax8, ax9]:
-                    lns, lbs = ax.get_legend_handles_labels()
-                    lines.extend(lns)
-                    labels.extend(lbs)
-                
-                # Place legend at the top of the chart
-                ax5.legend(lines, labels, loc='upper center', bbox_to_anchor=(0.5, 1.15), ncol=5)
-                
-                # Display the plot
-                st.pyplot(fig3)
+                combined_chart = multi_axis_chart(
+                    plot_df,
+                    axes=(
+                        ("Group Size (MOA)", (GROUP_SIZE_SERIES,)),
+                        ("Mean Radius (mm)", (MEAN_RADIUS_SERIES,)),
+                        ("Avg Velocity (fps)", (VELOCITY_SERIES,)),
+                        ("ES (fps)", (ES_SERIES,)),
+                        ("SD (fps)", (SD_SERIES,)),
+                    ),
+                    title="All Metrics Combined",
+                )
+                st.altair_chart(combined_chart, use_container_width=True)
                 
                 # Add explanation
                 st.markdown("""
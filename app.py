@@ -1,11 +1,80 @@
+import functools
 import streamlit as st
 import datetime
 import os
 import re
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 import utils
 from utils import load_component_lists
 
+# Patterns used by clean_str, compiled once at import
+_RE_STRIP = re.compile(r'[^\w\s-]')
+_RE_WS = re.compile(r'\s+')
+
+# Weather conditions offered in the Environment tab, and their positions
+_WEATHER_OPTIONS = ("Clear", "Overcast", "Rain", "Fog", "Variable")
+_WEATHER_INDEX = {weather: i for i, weather in enumerate(_WEATHER_OPTIONS)}
+
+# Labels of the test data form tabs, in display order
+_TAB_LABELS = (
+    "📋 Test Info",
+    "🔫 Platform",
+    "🧪 Ammunition",
+    "🌡️ Environment",
+    "🎯 Results",
+    "📝 Notes",
+)
+
+# Picking Custom... in a dropdown does not rerun the form, so the matching
+# text field is always shown rather than only once Custom... is selected
+_CUSTOM_HELP = "Used when Custom... is selected above"
+
+# Separators that make an attachment name a path into a subfolder
+_PATH_SEPARATORS = tuple({"/", os.sep, os.altsep or os.sep})
+
+
+def test_folder_sort_key(folder: str) -> Tuple[str, int]:
+    """
+    Sort key ordering test folders by date and then by distance.
+    
+    Args:
+        folder: Test folder name
+    
+    Returns:
+        Tuple of (date, distance in metres)
+    """
+    parts = folder.split('__')
+    if len(parts) != 2:
+        return ("", 0)  # Default for invalid format
+    
+    date_part = parts[0]
+    
+    # Extract distance from the second part (e.g., "100m_...")
+    distance_part = parts[1].split('_')[0] if '_' in parts[1] else ""
+    try:
+        # Remove 'm' suffix if present and convert to integer
+        distance = int(distance_part.removesuffix('m'))
+    except (ValueError, AttributeError):
+        distance = 0
+        
+    return (date_part, distance)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_test_folders() -> Tuple[List[str], List[str]]:
+    """
+    List the test folders, reusing the listing across reruns.
+    
+    The cache expires after 30 seconds and is cleared whenever this page
+    saves a test, so new folders show up straight away.
+    
+    Returns:
+        Tuple of (test folder names sorted by date and distance, the same
+        names lowercased for searching)
+    """
+    folders = sorted(utils.get_test_folders(), key=test_folder_sort_key)
+    return folders, [folder.lower() for folder in folders]
+
 def create_empty_test_data() -> Dict[str, Any]:
     """
     Create an empty test data structure with default values.
@@ -92,84 +161,112 @@ def create_empty_test_data() -> Dict[str, Any]:
     }
 
 
-def parse_test_id(test_id: str) -> Tuple[str, str, str, str, str, str, str, str, str, str, str, str, str, str]:
+class ParsedTestID(NamedTuple):
+    """Components of a test ID, as the strings found in the ID."""
+    date: str
+    distance: str
+    calibre: str
+    rifle: str
+    case_brand: str
+    bullet_brand: str
+    bullet_model: str
+    bullet_weight: str
+    powder_brand: str
+    powder_model: str
+    charge: str
+    coal: str
+    b2o: str
+    primer_brand: str
+    primer_model: str
+
+
+# Returned when a test ID cannot be parsed
+EMPTY_PARSED_TEST_ID = ParsedTestID("", "", "", "", "", "", "", "", "", "", "", "", "", "", "")
+
+
+def parse_test_id(test_id: str) -> ParsedTestID:
     """
     Parse a test ID into its components.
     
     Args:
         test_id: Test ID string in the format:
-                [Date]__[Distance]_[Calibre]_[Rifle]_[CaseBrand]_[BulletBrand]_[BulletModel]_[BulletWeight]_[PowderBrand]_[Powder]_[Charge]_[COAL]_[PrimerBrand]_[Primer]
+                [Date]__[Distance]_[Calibre]_[Rifle]_[CaseBrand]_[BulletBrand]_[BulletModel]_[BulletWeight]_[PowderBrand]_[Powder]_[Charge]_[COAL]_[B2O]_[PrimerBrand]_[Primer]
     
     Returns:
-        Tuple of (date, distance, calibre, rifle, case_brand, bullet_brand, bullet_model, bullet_weight, powder_brand, powder_model, charge, coal, primer_brand, primer_model)
+        ParsedTestID with the components, all empty if the ID cannot be parsed
     """
-    try:
-        # Split by double underscore first
-        parts = test_id.split('__')
-        if len(parts) != 2:
-            return ("", "", "", "", "", "", "", "", "", "", "", "", "", "")
-        
-        date_part = parts[0]
-        rest = parts[1]
-        
-        # Split the rest by single underscore
-        parts = rest.split('_')
+    # Split by double underscore first, which must appear exactly once
+    date_part, sep, rest = test_id.partition('__')
+    if not sep or '__' in rest:
+        return EMPTY_PARSED_TEST_ID
+    
+    # Split the rest by single underscore
+    parts = rest.split('_')
+    
+    # Check if we have enough parts for the new format
+    if len(parts) >= 14:
+        # New format with all brand fields
+        return ParsedTestID(
+            date=date_part,
+            distance=parts[0],
+            calibre=parts[1],
+            rifle=parts[2],
+            case_brand=parts[3],
+            bullet_brand=parts[4],
+            bullet_model=parts[5],
+            bullet_weight=parts[6],
+            powder_brand=parts[7],
+            powder_model=parts[8],
+            charge=parts[9],
+            coal=parts[10],
+            b2o=parts[11],
+            primer_brand=parts[12],
+            primer_model=parts[13],
+        )
+    else:
+        # Old format without brand fields or B2O
+        # This is for backward compatibility
+        if len(parts) < 9:
+            # Not enough parts, return empty values
+            return EMPTY_PARSED_TEST_ID
         
-        # Check if we have enough parts for the new format
-        if len(parts) >= 14:
-            # New format with all brand fields
-            distance = parts[0]
-            calibre = parts[1]
-            rifle = parts[2]
-            case_brand = parts[3]
-            bullet_brand = parts[4]
-            bullet_model = parts[5]
-            bullet_weight = parts[6]
-            powder_brand = parts[7]
-            powder_model = parts[8]
-            charge = parts[9]
-            coal = parts[10]
-            b2o = parts[11]
-            primer_brand = parts[12]
-            primer_model = parts[13]
-            
-            # Parse B2O
-            if b2o.endswith('in'):
-                b2o = b2o[:-2]  # Remove 'in' suffix
-            try:
-                data["ammo"]["b2o_in"] = float(b2o)
-            except ValueError:
-                pass
+        # The brand fields are left empty
+        return ParsedTestID(
+            date=date_part,
+            distance=parts[0],
+            calibre=parts[1],
+            rifle=parts[2],
+            case_brand="",
+            bullet_brand="",
+            bullet_model=parts[3],
+            bullet_weight=parts[4],
+            powder_brand="",
+            powder_model=parts[5],
+            charge=parts[6],
+            coal=parts[7],
+            b2o="",
+            primer_brand="",
+            primer_model=parts[8],
+        )
 
-            return (date_part, distance, calibre, rifle, case_brand, bullet_brand, bullet_model, bullet_weight, powder_brand, powder_model, charge, coal, primer_brand, primer_model)
-        else:
-            # Old format without brand fields
-            # This is for backward compatibility
-            if len(parts) < 9:
-                # Not enough parts, return empty values
-                return ("", "", "", "", "", "", "", "", "", "", "", "", "", "")
-            
-            distance = parts[0]
-            calibre = parts[1]
-            rifle = parts[2]
-            bullet_model = parts[3]
-            bullet_weight = parts[4]
-            powder_model = parts[5]
-            charge = parts[6]
-            coal = parts[7]
-            primer_model = parts[8]
-            
-            # Fill in empty values for the new fields
-            case_brand = ""
-            bullet_brand = ""
-            powder_brand = ""
-            primer_brand = ""
-            
-            return (date_part, distance, calibre, rifle, case_brand, bullet_brand, bullet_model, bullet_weight, powder_brand, powder_model, charge, coal, primer_brand, primer_model)
-    except Exception as e:
-        print(f"Error parsing test ID: {e}")
-        # If parsing fails, return empty values
-        return ("", "", "", "", "", "", "", "", "", "", "", "", "", "")
+
+@functools.lru_cache(maxsize=512)
+def clean_str(s: str) -> str:
+    """
+    Make a component name safe for use in a test ID.
+    
+    Results are memoized, as the same few component names recur across
+    generated IDs.
+    
+    Args:
+        s: Component name
+    
+    Returns:
+        Name with special characters removed and spaces replaced by hyphens
+    """
+    s = _RE_STRIP.sub('', s)  # Remove special chars except hyphen
+    s = _RE_WS.sub('-', s)    # Replace spaces with hyphens
+    return s
 
 
 def generate_test_id(date: str, distance_m: int, calibre: str, rifle: str, 
@@ -188,21 +285,12 @@ def generate_test_id(date: str, distance_m: int, calibre: str, rifle: str,
     # Keep the date format with hyphens (original format)
     date_str = date
     
-    # Replace spaces with hyphens and remove special characters
-    def clean_str(s: str) -> str:
-        s = re.sub(r'[^\w\s-]', '', s)  # Remove special chars except hyphen
-        s = re.sub(r'\s+', '-', s)      # Replace spaces with hyphens
-        return s
-    
-    calibre_clean = clean_str(calibre)
-    rifle_clean = clean_str(rifle)
-    case_brand_clean = clean_str(case_brand)
-    bullet_brand_clean = clean_str(bullet_brand)
-    bullet_model_clean = clean_str(bullet_model)
-    powder_brand_clean = clean_str(powder_brand)
-    powder_model_clean = clean_str(powder_model)
-    primer_brand_clean = clean_str(primer_brand)
-    primer_model_clean = clean_str(primer_model)
+    (calibre_clean, rifle_clean, case_brand_clean, bullet_brand_clean, bullet_model_clean,
+     powder_brand_clean, powder_model_clean, primer_brand_clean, primer_model_clean) = map(
+        clean_str,
+        (calibre, rifle, case_brand, bullet_brand, bullet_model,
+         powder_brand, powder_model, primer_brand, primer_model),
+    )
     
     # Format the test ID with the original format
     # Use integer values for weights (no decimal points) and format COAL with 3 decimal places
@@ -219,11 +307,37 @@ def load_test_data(test_id: str) -> Dict[str, Any]:
         test_id: Test ID to load
     
     Returns:
-        Dictionary containing the test data
+        Dictionary containing the test data, which the caller may modify
     """
     if not test_id:
         return create_empty_test_data()
     
+    # Key the cache on the YAML file's modification time as well, so edits
+    # made outside this page are picked up on the next rerun
+    try:
+        mtime_ns = os.stat(utils.get_test_file_path(test_id)).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _cached_load(test_id, mtime_ns)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_load(test_id: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Load and cache test data for a specific test ID.
+    
+    Every caller receives its own copy of the cached dictionary. The cache
+    is cleared whenever this page saves a test, and only the most recently
+    loaded tests are kept, as each edit of a YAML file adds a new entry.
+    
+    Args:
+        test_id: Test ID to load
+        mtime_ns: Modification time of the test's YAML file, or 0 if it
+            does not exist
+    
+    Returns:
+        Dictionary containing the test data
+    """
     data = utils.get_test_data(test_id)
     
     # If no data was found, create empty data
@@ -232,62 +346,72 @@ def load_test_data(test_id: str) -> Dict[str, Any]:
         data["test_id"] = test_id
         
         # Try to parse test ID to pre-fill some fields
-        date_str, distance_str, calibre, rifle, case_brand, bullet_brand, bullet_model, bullet_weight_str, powder_brand, powder_model, powder_charge_str, coal_str, primer_brand, primer_model = parse_test_id(test_id)
+        parsed = parse_test_id(test_id)
         
-        if date_str:
+        # Format date as YYYY-MM-DD
+        if len(parsed.date) == 8:  # YYYYMMDD format
+            data["date"] = f"{parsed.date[:4]}-{parsed.date[4:6]}-{parsed.date[6:8]}"
+        else:
+            # IDs from generate_test_id already use YYYY-MM-DD
             try:
-                # Format date as YYYY-MM-DD
-                if len(date_str) == 8:  # YYYYMMDD format
-                    data["date"] = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-            except:
+                data["date"] = datetime.date.fromisoformat(parsed.date).isoformat()
+            except ValueError:
                 pass
                 
-        if distance_str:
+        if parsed.distance:
             try:
                 # Remove 'm' suffix if present
-                distance_str = distance_str.rstrip('m')
+                distance_str = parsed.distance.removesuffix('m')
                 data["distance_m"] = int(distance_str)
-            except:
+            except ValueError:
                 pass
                 
         # Platform
-        data["platform"]["calibre"] = calibre
-        data["platform"]["rifle"] = rifle
+        data["platform"]["calibre"] = parsed.calibre
+        data["platform"]["rifle"] = parsed.rifle
         
         # Case
-        data["ammo"]["case"]["brand"] = case_brand
+        data["ammo"]["case"]["brand"] = parsed.case_brand
         
         # Bullet
-        data["ammo"]["bullet"]["brand"] = bullet_brand
-        data["ammo"]["bullet"]["model"] = bullet_model
+        data["ammo"]["bullet"]["brand"] = parsed.bullet_brand
+        data["ammo"]["bullet"]["model"] = parsed.bullet_model
         try:
             # Remove 'gr' suffix if present
-            bullet_weight_str = bullet_weight_str.rstrip('gr')
+            bullet_weight_str = parsed.bullet_weight.removesuffix('gr')
             data["ammo"]["bullet"]["weight_gr"] = float(bullet_weight_str)
-        except:
+        except ValueError:
             pass
             
         # Powder
-        data["ammo"]["powder"]["brand"] = powder_brand
-        data["ammo"]["powder"]["model"] = powder_model
+        data["ammo"]["powder"]["brand"] = parsed.powder_brand
+        data["ammo"]["powder"]["model"] = parsed.powder_model
         try:
             # Remove 'gr' suffix if present
-            powder_charge_str = powder_charge_str.rstrip('gr')
+            powder_charge_str = parsed.charge.removesuffix('gr')
             data["ammo"]["powder"]["charge_gr"] = float(powder_charge_str)
-        except:
+        except ValueError:
             pass
             
         # COAL
         try:
             # Remove 'in' suffix if present
-            coal_str = coal_str.rstrip('in')
+            coal_str = parsed.coal.removesuffix('in')
             data["ammo"]["coal_in"] = float(coal_str)
-        except:
+        except ValueError:
+            pass
+            
+        # B2O
+        try:
+            # Remove 'in' suffix if present
+            b2o_str = parsed.b2o.removesuffix('in')
+            data["ammo"]["b2o_in"] = float(b2o_str)
+        except ValueError:
             pass
             
         # Primer
-        data["ammo"]["primer"]["brand"] = primer_brand
-        data["ammo"]["primer"]["model"] = primer_model
+        data["ammo"]["primer"]["brand"] = parsed.primer_brand
+        data["ammo"]["primer"]["model"] = parsed.primer_model
     
     return data
 
@@ -310,37 +434,25 @@ def main():
     with st.sidebar:
         st.header("Test Selection")
         
-        # Get list of test folders
-        test_folders = utils.get_test_folders()
+        # Get list of test folders, rescanning the tests directory on request
+        if st.button("Refresh", key="refresh_tests"):
+            _cached_test_folders.clear()
+        test_folders, test_folders_lower = _cached_test_folders()
         
         # Add search box for filtering tests
         search_query = st.text_input("Search Tests", key="search_tests", placeholder="Filter by test ID...")
         
-        # Sort test folders by date and then by distance
-        def sort_key(folder):
-            parts = folder.split('__')
-            if len(parts) != 2:
-                return ("", 0)  # Default for invalid format
-            
-            date_part = parts[0]
-            
-            # Extract distance from the second part (e.g., "100m_...")
-            distance_part = parts[1].split('_')[0] if '_' in parts[1] else ""
-            try:
-                # Remove 'm' suffix if present and convert to integer
-                distance = int(distance_part.rstrip('m'))
-            except (ValueError, AttributeError):
-                distance = 0
-                
-            return (date_part, distance)
-        
-        sorted_test_folders = sorted(test_folders, key=sort_key)
-        
-        # Filter test folders based on search query
-        if search_query:
-            filtered_test_folders = [folder for folder in sorted_test_folders if search_query.lower() in folder.lower()]
+        # Filter test folders based on search query, matching against the
+        # cached lowercase names. Folder names never contain spaces, so each
+        # word of the query must appear somewhere in the name.
+        tokens = search_query.lower().split()
+        if tokens:
+            filtered_test_folders = [
+                folder for folder, folder_lower in zip(test_folders, test_folders_lower)
+                if all(token in folder_lower for token in tokens)
+            ]
         else:
-            filtered_test_folders = sorted_test_folders
+            filtered_test_folders = test_folders
         
         # Option to create a new test
         new_test = st.checkbox("Create new test", key="new_test_checkbox")
@@ -599,21 +711,26 @@ def main():
             # Update the form fields with the generated values
             test_data["date"] = gen_date.isoformat()
             test_data["distance_m"] = gen_distance_m
-            test_data["platform"]["calibre"] = gen_calibre
-            test_data["platform"]["rifle"] = gen_rifle
-            test_data["ammo"]["case"]["brand"] = gen_case_brand
-            test_data["ammo"]["bullet"]["brand"] = gen_bullet_brand
-            test_data["ammo"]["bullet"]["model"] = gen_bullet_model
-            test_data["ammo"]["bullet"]["weight_gr"] = gen_bullet_weight
-            test_data["ammo"]["powder"]["brand"] = gen_powder_brand
-            test_data["ammo"]["powder"]["model"] = gen_powder_model
-            test_data["ammo"]["powder"]["charge_gr"] = gen_powder_charge
-            test_data["ammo"]["coal_in"] = gen_coal
-            test_data["ammo"]["primer"]["brand"] = gen_primer_brand
-            test_data["ammo"]["primer"]["model"] = gen_primer_model
+            platform = test_data["platform"]
+            ammo = test_data["ammo"]
+            case, bullet, powder, primer = ammo["case"], ammo["bullet"], ammo["powder"], ammo["primer"]
+            platform["calibre"] = gen_calibre
+            platform["rifle"] = gen_rifle
+            case["brand"] = gen_case_brand
+            bullet["brand"] = gen_bullet_brand
+            bullet["model"] = gen_bullet_model
+            bullet["weight_gr"] = gen_bullet_weight
+            powder["brand"] = gen_powder_brand
+            powder["model"] = gen_powder_model
+            powder["charge_gr"] = gen_powder_charge
+            ammo["coal_in"] = gen_coal
+            primer["brand"] = gen_primer_brand
+            primer["model"] = gen_primer_model
             
             # Save the data immediately to ensure it's not lost
             utils.save_test_data(new_test_id, test_data)
+            _cached_test_folders.clear()
+            _cached_load.clear()
             st.success(f"Test data for '{new_test_id}' saved successfully!")
     
     # Display current test ID
@@ -632,18 +749,25 @@ def main():
             # Update test_data with the saved data
             test_data.update(saved_data)
     
-    # Create tabs for different sections
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "📋 Test Info", 
-        "🔫 Platform", 
-        "🧪 Ammunition", 
-        "🌡️ Environment", 
-        "🎯 Results", 
-        "📝 Notes"
-    ])
+    # Without a test ID there is nothing the form could be saved to, so skip
+    # building it until a test is selected or generated
+    if not test_data["test_id"]:
+        if not new_test:
+            st.info("Select an existing test, or create a new test, to edit its data.")
+        return
+    
+    # Sections of test_data read and written by the Platform and Ammunition
+    # tabs. Taken after the saved data is merged in, as update() replaces them.
+    platform = test_data["platform"]
+    ammo = test_data["ammo"]
+    case, bullet, powder, primer = ammo["case"], ammo["bullet"], ammo["powder"], ammo["primer"]
     
-    # Main form - moved outside of tabs
+    # The tabs are laid out inside the form, so editing a field in any of
+    # them does not rerun the script. Every value is sent together when
+    # Save Test Data is submitted.
     with st.form("test_data_form"):
+        # Create tabs for different sections
+        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(_TAB_LABELS)
         
         # Tab 1: Test Information
         with tab1:
@@ -653,14 +777,16 @@ def main():
             with col1:
                 date = st.date_input(
                     "Date", 
-                    value=datetime.date.fromisoformat(test_data["date"]) if test_data["date"] else datetime.date.today()
+                    value=datetime.date.fromisoformat(test_data["date"]) if test_data["date"] else datetime.date.today(),
+                    key="test_date"
                 )
             with col2:
                 distance_m = st.number_input(
                     "Distance (m)", 
                     min_value=0, 
                     value=int(test_data["distance_m"]),
-                    step=25
+                    step=25,
+                    key="test_distance"
                 )
         
         # Tab 2: Platform
@@ -671,48 +797,49 @@ def main():
             with col1:
                 # Calibre dropdown - only from predefined list
                 calibre_options = component_lists.get("calibre", [])
-                if test_data["platform"]["calibre"] and test_data["platform"]["calibre"] not in calibre_options:
-                    calibre_options = [test_data["platform"]["calibre"]] + calibre_options
+                if platform["calibre"] and platform["calibre"] not in calibre_options:
+                    calibre_options = [platform["calibre"]] + calibre_options
                 
                 # Add a selectbox for existing options only (no Custom option)
-                test_data["platform"]["calibre"] = st.selectbox(
+                platform["calibre"] = st.selectbox(
                     "Calibre", 
                     options=calibre_options,
-                    index=calibre_options.index(test_data["platform"]["calibre"]) if test_data["platform"]["calibre"] in calibre_options else 0,
+                    index=calibre_options.index(platform["calibre"]) if platform["calibre"] in calibre_options else 0,
                     key="platform_calibre"
                 )
                 
                 # Use selectbox with option to add custom value for Rifle
                 rifle_options = component_lists.get("rifle", [])
-                if test_data["platform"]["rifle"] and test_data["platform"]["rifle"] not in rifle_options:
-                    rifle_options = [test_data["platform"]["rifle"]] + rifle_options
+                if platform["rifle"] and platform["rifle"] not in rifle_options:
+                    rifle_options = [platform["rifle"]] + rifle_options
                 
                 selected_rifle = st.selectbox(
                     "Rifle", 
                     options=rifle_options + ["Custom..."],
-                    index=rifle_options.index(test_data["platform"]["rifle"]) if test_data["platform"]["rifle"] in rifle_options else len(rifle_options),
+                    index=rifle_options.index(platform["rifle"]) if platform["rifle"] in rifle_options else len(rifle_options),
                     key="platform_rifle"
                 )
-                if selected_rifle == "Custom...":
-                    test_data["platform"]["rifle"] = st.text_input(
-                        "Custom Rifle", 
-                        value="",
-                        placeholder="e.g. Tikka_T3x",
-                        key="platform_rifle_custom"
-                    )
-                else:
-                    test_data["platform"]["rifle"] = selected_rifle
+                custom_rifle = st.text_input(
+                    "Custom Rifle", 
+                    value="",
+                    placeholder="e.g. Tikka_T3x",
+                    key="platform_rifle_custom",
+                    help=_CUSTOM_HELP
+                )
+                platform["rifle"] = custom_rifle if selected_rifle == "Custom..." else selected_rifle
             with col2:
-                test_data["platform"]["barrel_length_in"] = st.number_input(
+                platform["barrel_length_in"] = st.number_input(
                     "Barrel Length (inches)", 
                     min_value=0.0, 
-                    value=float(test_data["platform"]["barrel_length_in"]),
-                    step=0.1
+                    value=float(platform["barrel_length_in"]),
+                    step=0.1,
+                    key="platform_barrel_length"
                 )
-                test_data["platform"]["twist_rate"] = st.text_input(
+                platform["twist_rate"] = st.text_input(
                     "Twist Rate", 
-                    value=test_data["platform"]["twist_rate"],
-                    placeholder="e.g. 1:8"
+                    value=platform["twist_rate"],
+                    placeholder="e.g. 1:8",
+                    key="platform_twist_rate"
                 )
         
         # Tab 3: Ammunition
@@ -725,71 +852,70 @@ def main():
             with col1:
                 # Use selectbox with option to add custom value for Case Brand
                 case_brand_options = component_lists.get("case_brand", [])
-                if test_data["ammo"]["case"]["brand"] and test_data["ammo"]["case"]["brand"] not in case_brand_options:
-                    case_brand_options = [test_data["ammo"]["case"]["brand"]] + case_brand_options
+                if case["brand"] and case["brand"] not in case_brand_options:
+                    case_brand_options = [case["brand"]] + case_brand_options
                 
                 selected_case_brand = st.selectbox(
                     "Brand", 
                     options=case_brand_options + ["Custom..."],
-                    index=case_brand_options.index(test_data["ammo"]["case"]["brand"]) if test_data["ammo"]["case"]["brand"] in case_brand_options else len(case_brand_options),
+                    index=case_brand_options.index(case["brand"]) if case["brand"] in case_brand_options else len(case_brand_options),
                     key="case_brand_select"
                 )
-                if selected_case_brand == "Custom...":
-                    test_data["ammo"]["case"]["brand"] = st.text_input(
-                        "Custom Case Brand", 
-                        value="",
-                        placeholder="e.g. Sako",
-                        key="case_brand_custom"
-                    )
-                else:
-                    test_data["ammo"]["case"]["brand"] = selected_case_brand
+                custom_case_brand = st.text_input(
+                    "Custom Case Brand", 
+                    value="",
+                    placeholder="e.g. Sako",
+                    key="case_brand_custom",
+                    help=_CUSTOM_HELP
+                )
+                case["brand"] = custom_case_brand if selected_case_brand == "Custom..." else selected_case_brand
                 
                 # Brass Sizing dropdown
                 # Handle case when brass_sizing doesn't exist in test_data
-                if "brass_sizing" not in test_data["ammo"]["case"]:
-                    test_data["ammo"]["case"]["brass_sizing"] = "Full"
+                if "brass_sizing" not in case:
+                    case["brass_sizing"] = "Full"
                 
                 brass_sizing_options = component_lists.get("brass_sizing", ["Full", "Neck Only with Bushing"])
-                if test_data["ammo"]["case"]["brass_sizing"] and test_data["ammo"]["case"]["brass_sizing"] not in brass_sizing_options:
-                    brass_sizing_options = [test_data["ammo"]["case"]["brass_sizing"]] + brass_sizing_options
+                if case["brass_sizing"] and case["brass_sizing"] not in brass_sizing_options:
+                    brass_sizing_options = [case["brass_sizing"]] + brass_sizing_options
                 
-                test_data["ammo"]["case"]["brass_sizing"] = st.selectbox(
+                case["brass_sizing"] = st.selectbox(
                     "Brass Sizing", 
                     options=brass_sizing_options,
-                    index=brass_sizing_options.index(test_data["ammo"]["case"]["brass_sizing"]) if test_data["ammo"]["case"]["brass_sizing"] in brass_sizing_options else 0,
+                    index=brass_sizing_options.index(case["brass_sizing"]) if case["brass_sizing"] in brass_sizing_options else 0,
                     key="brass_sizing"
                 )
                 
                 # Shoulder Bump (float, 2 decimals, thousands of an inch)
                 # Handle case when shoulder_bump doesn't exist in test_data
-                if "shoulder_bump" not in test_data["ammo"]["case"]:
-                    test_data["ammo"]["case"]["shoulder_bump"] = 0.0
+                if "shoulder_bump" not in case:
+                    case["shoulder_bump"] = 0.0
                 
-                test_data["ammo"]["case"]["shoulder_bump"] = st.number_input(
+                case["shoulder_bump"] = st.number_input(
                     "Shoulder Bump (thousandths of an inch)", 
                     min_value=0.0, 
-                    value=float(test_data["ammo"]["case"]["shoulder_bump"]),
+                    value=float(case["shoulder_bump"]),
                     step=0.01,
                     format="%.2f",
                     key="shoulder_bump"
                 )
             with col2:
-                test_data["ammo"]["case"]["lot"] = st.text_input(
+                case["lot"] = st.text_input(
                     "Lot", 
-                    value=test_data["ammo"]["case"]["lot"],
+                    value=case["lot"],
                     key="case_lot", 
                     placeholder="e.g. SK-001"
                 )
                 
                 # Bushing Size (float, 3 decimals)
                 # Handle case when bushing_size doesn't exist in test_data
-                if "bushing_size" not in test_data["ammo"]["case"]:
-                    test_data["ammo"]["case"]["bushing_size"] = 0.0
+                if "bushing_size" not in case:
+                    case["bushing_size"] = 0.0
                 
-                test_data["ammo"]["case"]["bushing_size"] = st.number_input(
+                case["bushing_size"] = st.number_input(
                     "Bushing Size (inches)", 
                     min_value=0.0, 
-                    value=float(test_data["ammo"]["case"]["bushing_size"]),
+                    value=float(case["bushing_size"]),
                     step=0.001,
                     format="%.3f",
                     key="bushing_size"
@@ -797,13 +923,13 @@ def main():
                 
                 # Neck Turned (Yes/No)
                 # Handle case when neck_turned doesn't exist in test_data
-                if "neck_turned" not in test_data["ammo"]["case"]:
-                    test_data["ammo"]["case"]["neck_turned"] = "No"
+                if "neck_turned" not in case:
+                    case["neck_turned"] = "No"
                 
-                test_data["ammo"]["case"]["neck_turned"] = st.selectbox(
+                case["neck_turned"] = st.selectbox(
                     "Neck Turned", 
                     options=["Yes", "No"],
-                    index=0 if test_data["ammo"]["case"]["neck_turned"] == "Yes" else 1,
+                    index=0 if case["neck_turned"] == "Yes" else 1,
                     key="neck_turned"
                 )
             
@@ -813,57 +939,55 @@ def main():
             with col1:
                 # Use selectbox with option to add custom value for Bullet Brand
                 bullet_brand_options = component_lists.get("bullet_brand", [])
-                if test_data["ammo"]["bullet"]["brand"] and test_data["ammo"]["bullet"]["brand"] not in bullet_brand_options:
-                    bullet_brand_options = [test_data["ammo"]["bullet"]["brand"]] + bullet_brand_options
+                if bullet["brand"] and bullet["brand"] not in bullet_brand_options:
+                    bullet_brand_options = [bullet["brand"]] + bullet_brand_options
                 
                 selected_bullet_brand = st.selectbox(
                     "Brand", 
                     options=bullet_brand_options + ["Custom..."],
-                    index=bullet_brand_options.index(test_data["ammo"]["bullet"]["brand"]) if test_data["ammo"]["bullet"]["brand"] in bullet_brand_options else len(bullet_brand_options),
+                    index=bullet_brand_options.index(bullet["brand"]) if bullet["brand"] in bullet_brand_options else len(bullet_brand_options),
                     key="bullet_brand_select"
                 )
-                if selected_bullet_brand == "Custom...":
-                    test_data["ammo"]["bullet"]["brand"] = st.text_input(
-                        "Custom Bullet Brand", 
-                        value="",
-                        placeholder="e.g. Hornady",
-                        key="bullet_brand_custom"
-                    )
-                else:
-                    test_data["ammo"]["bullet"]["brand"] = selected_bullet_brand
+                custom_bullet_brand = st.text_input(
+                    "Custom Bullet Brand", 
+                    value="",
+                    placeholder="e.g. Hornady",
+                    key="bullet_brand_custom",
+                    help=_CUSTOM_HELP
+                )
+                bullet["brand"] = custom_bullet_brand if selected_bullet_brand == "Custom..." else selected_bullet_brand
                 
                 # Use selectbox with option to add custom value for Bullet Model
                 bullet_model_options = component_lists.get("bullet_model", [])
-                if test_data["ammo"]["bullet"]["model"] and test_data["ammo"]["bullet"]["model"] not in bullet_model_options:
-                    bullet_model_options = [test_data["ammo"]["bullet"]["model"]] + bullet_model_options
+                if bullet["model"] and bullet["model"] not in bullet_model_options:
+                    bullet_model_options = [bullet["model"]] + bullet_model_options
                 
                 selected_bullet_model = st.selectbox(
                     "Model", 
                     options=bullet_model_options + ["Custom..."],
-                    index=bullet_model_options.index(test_data["ammo"]["bullet"]["model"]) if test_data["ammo"]["bullet"]["model"] in bullet_model_options else len(bullet_model_options),
+                    index=bullet_model_options.index(bullet["model"]) if bullet["model"] in bullet_model_options else len(bullet_model_options),
                     key="bullet_model_select"
                 )
-                if selected_bullet_model == "Custom...":
-                    test_data["ammo"]["bullet"]["model"] = st.text_input(
-                        "Custom Bullet Model", 
-                        value="",
-                        placeholder="e.g. ELD-M",
-                        key="bullet_model_custom"
-                    )
-                else:
-                    test_data["ammo"]["bullet"]["model"] = selected_bullet_model
+                custom_bullet_model = st.text_input(
+                    "Custom Bullet Model", 
+                    value="",
+                    placeholder="e.g. ELD-M",
+                    key="bullet_model_custom",
+                    help=_CUSTOM_HELP
+                )
+                bullet["model"] = custom_bullet_model if selected_bullet_model == "Custom..." else selected_bullet_model
             with col2:
-                test_data["ammo"]["bullet"]["lot"] = st.text_input(
+                bullet["lot"] = st.text_input(
                     "Lot", 
-                    value=test_data["ammo"]["bullet"]["lot"],
+                    value=bullet["lot"],
                     key="bullet_lot", 
                     placeholder="e.g. HD2204A"
                 )
                 
-                test_data["ammo"]["bullet"]["weight_gr"] = st.number_input(
+                bullet["weight_gr"] = st.number_input(
                     "Weight (gr)", 
                     min_value=0.0, 
-                    value=float(test_data["ammo"]["bullet"]["weight_gr"]),
+                    value=float(bullet["weight_gr"]),
                     key="bullet_weight", 
                     step=0.1
                 )
@@ -874,57 +998,55 @@ def main():
             with col1:
                 # Use selectbox with option to add custom value for Powder Brand
                 powder_brand_options = component_lists.get("powder_brand", [])
-                if test_data["ammo"]["powder"]["brand"] and test_data["ammo"]["powder"]["brand"] not in powder_brand_options:
-                    powder_brand_options = [test_data["ammo"]["powder"]["brand"]] + powder_brand_options
+                if powder["brand"] and powder["brand"] not in powder_brand_options:
+                    powder_brand_options = [powder["brand"]] + powder_brand_options
                 
                 selected_powder_brand = st.selectbox(
                     "Brand", 
                     options=powder_brand_options + ["Custom..."],
-                    index=powder_brand_options.index(test_data["ammo"]["powder"]["brand"]) if test_data["ammo"]["powder"]["brand"] in powder_brand_options else len(powder_brand_options),
+                    index=powder_brand_options.index(powder["brand"]) if powder["brand"] in powder_brand_options else len(powder_brand_options),
                     key="powder_brand_select"
                 )
-                if selected_powder_brand == "Custom...":
-                    test_data["ammo"]["powder"]["brand"] = st.text_input(
-                        "Custom Powder Brand", 
-                        value="",
-                        placeholder="e.g. ADI",
-                        key="powder_brand_custom"
-                    )
-                else:
-                    test_data["ammo"]["powder"]["brand"] = selected_powder_brand
+                custom_powder_brand = st.text_input(
+                    "Custom Powder Brand", 
+                    value="",
+                    placeholder="e.g. ADI",
+                    key="powder_brand_custom",
+                    help=_CUSTOM_HELP
+                )
+                powder["brand"] = custom_powder_brand if selected_powder_brand == "Custom..." else selected_powder_brand
                 
                 # Use selectbox with option to add custom value for Powder Model
                 powder_model_options = component_lists.get("powder_model", [])
-                if test_data["ammo"]["powder"]["model"] and test_data["ammo"]["powder"]["model"] not in powder_model_options:
-                    powder_model_options = [test_data["ammo"]["powder"]["model"]] + powder_model_options
+                if powder["model"] and powder["model"] not in powder_model_options:
+                    powder_model_options = [powder["model"]] + powder_model_options
                 
                 selected_powder_model = st.selectbox(
                     "Model", 
                     options=powder_model_options + ["Custom..."],
-                    index=powder_model_options.index(test_data["ammo"]["powder"]["model"]) if test_data["ammo"]["powder"]["model"] in powder_model_options else len(powder_model_options),
+                    index=powder_model_options.index(powder["model"]) if powder["model"] in powder_model_options else len(powder_model_options),
                     key="powder_model_select"
                 )
-                if selected_powder_model == "Custom...":
-                    test_data["ammo"]["powder"]["model"] = st.text_input(
-                        "Custom Powder Model", 
-                        value="",
-                        placeholder="e.g. 2208",
-                        key="powder_model_custom"
-                    )
-                else:
-                    test_data["ammo"]["powder"]["model"] = selected_powder_model
+                custom_powder_model = st.text_input(
+                    "Custom Powder Model", 
+                    value="",
+                    placeholder="e.g. 2208",
+                    key="powder_model_custom",
+                    help=_CUSTOM_HELP
+                )
+                powder["model"] = custom_powder_model if selected_powder_model == "Custom..." else selected_powder_model
             with col2:
-                test_data["ammo"]["powder"]["lot"] = st.text_input(
+                powder["lot"] = st.text_input(
                     "Lot", 
-                    value=test_data["ammo"]["powder"]["lot"],
+                    value=powder["lot"],
                     key="powder_lot", 
                     placeholder="e.g. ADI-2208-03"
                 )
                 
-                test_data["ammo"]["powder"]["charge_gr"] = st.number_input(
+                powder["charge_gr"] = st.number_input(
                     "Charge (gr)", 
                     min_value=0.0, 
-                    value=float(test_data["ammo"]["powder"]["charge_gr"]),
+                    value=float(powder["charge_gr"]),
                     key="powder_charge", 
                     step=0.1
                 )
@@ -935,49 +1057,47 @@ def main():
             with col1:
                 # Use selectbox with option to add custom value for Primer Brand
                 primer_brand_options = component_lists.get("primer_brand", [])
-                if test_data["ammo"]["primer"]["brand"] and test_data["ammo"]["primer"]["brand"] not in primer_brand_options:
-                    primer_brand_options = [test_data["ammo"]["primer"]["brand"]] + primer_brand_options
+                if primer["brand"] and primer["brand"] not in primer_brand_options:
+                    primer_brand_options = [primer["brand"]] + primer_brand_options
                 
                 selected_primer_brand = st.selectbox(
                     "Brand", 
                     options=primer_brand_options + ["Custom..."],
-                    index=primer_brand_options.index(test_data["ammo"]["primer"]["brand"]) if test_data["ammo"]["primer"]["brand"] in primer_brand_options else len(primer_brand_options),
+                    index=primer_brand_options.index(primer["brand"]) if primer["brand"] in primer_brand_options else len(primer_brand_options),
                     key="primer_brand_select"
                 )
-                if selected_primer_brand == "Custom...":
-                    test_data["ammo"]["primer"]["brand"] = st.text_input(
-                        "Custom Primer Brand", 
-                        value="",
-                        placeholder="e.g. CCI",
-                        key="primer_brand_custom"
-                    )
-                else:
-                    test_data["ammo"]["primer"]["brand"] = selected_primer_brand
+                custom_primer_brand = st.text_input(
+                    "Custom Primer Brand", 
+                    value="",
+                    placeholder="e.g. CCI",
+                    key="primer_brand_custom",
+                    help=_CUSTOM_HELP
+                )
+                primer["brand"] = custom_primer_brand if selected_primer_brand == "Custom..." else selected_primer_brand
                 
                 # Use selectbox with option to add custom value for Primer Model
                 primer_model_options = component_lists.get("primer_model", [])
-                if test_data["ammo"]["primer"]["model"] and test_data["ammo"]["primer"]["model"] not in primer_model_options:
-                    primer_model_options = [test_data["ammo"]["primer"]["model"]] + primer_model_options
+                if primer["model"] and primer["model"] not in primer_model_options:
+                    primer_model_options = [primer["model"]] + primer_model_options
                 
                 selected_primer_model = st.selectbox(
                     "Model", 
                     options=primer_model_options + ["Custom..."],
-                    index=primer_model_options.index(test_data["ammo"]["primer"]["model"]) if test_data["ammo"]["primer"]["model"] in primer_model_options else len(primer_model_options),
+                    index=primer_model_options.index(primer["model"]) if primer["model"] in primer_model_options else len(primer_model_options),
                     key="primer_model_select"
                 )
-                if selected_primer_model == "Custom...":
-                    test_data["ammo"]["primer"]["model"] = st.text_input(
-                        "Custom Primer Model", 
-                        value="",
-                        placeholder="e.g. BR4",
-                        key="primer_model_custom"
-                    )
-                else:
-                    test_data["ammo"]["primer"]["model"] = selected_primer_model
+                custom_primer_model = st.text_input(
+                    "Custom Primer Model", 
+                    value="",
+                    placeholder="e.g. BR4",
+                    key="primer_model_custom",
+                    help=_CUSTOM_HELP
+                )
+                primer["model"] = custom_primer_model if selected_primer_model == "Custom..." else selected_primer_model
             with col2:
-                test_data["ammo"]["primer"]["lot"] = st.text_input(
+                primer["lot"] = st.text_input(
                     "Lot", 
-                    value=test_data["ammo"]["primer"]["lot"],
+                    value=primer["lot"],
                     key="primer_lot", 
                     placeholder="e.g. CCI-BR4-B1"
                 )
@@ -985,23 +1105,25 @@ def main():
             # Cartridge Measurements
             st.subheader("Cartridge Measurements")
             # Ensure b2o_in exists in test_data
-            if "b2o_in" not in test_data["ammo"]:
-                test_data["ammo"]["b2o_in"] = 0.0
+            if "b2o_in" not in ammo:
+                ammo["b2o_in"] = 0.0
             
             col1, col2 = st.columns(2)
             with col1:
-                test_data["ammo"]["coal_in"] = st.number_input(
+                ammo["coal_in"] = st.number_input(
                     "Cartridge Overall Length - COAL (inches)", 
                     min_value=0.0, 
-                    value=float(test_data["ammo"]["coal_in"]),
-                    step=0.001
+                    value=float(ammo["coal_in"]),
+                    step=0.001,
+                    key="coal"
                 )
             with col2:
-                test_data["ammo"]["b2o_in"] = st.number_input(
+                ammo["b2o_in"] = st.number_input(
                     "Cartridge Base to Ogive - B2O (inches)",
                     min_value=0.0,
-                    value=float(test_data["ammo"]["b2o_in"]),
-                    step=0.001
+                    value=float(ammo["b2o_in"]),
+                    step=0.001,
+                    key="b2o"
                 )
         
         # Tab 4: Environment
@@ -1013,39 +1135,45 @@ def main():
                 test_data["environment"]["temperature_c"] = st.number_input(
                     "Temperature (°C)", 
                     value=float(test_data["environment"]["temperature_c"]),
-                    step=0.1
+                    step=0.1,
+                    key="env_temperature"
                 )
                 test_data["environment"]["humidity_percent"] = st.number_input(
                     "Humidity (%)", 
                     min_value=0, 
                     max_value=100, 
                     value=int(test_data["environment"]["humidity_percent"]),
-                    step=1
+                    step=1,
+                    key="env_humidity"
                 )
                 test_data["environment"]["pressure_hpa"] = st.number_input(
                     "Pressure (hPa)", 
                     min_value=0, 
                     value=int(test_data["environment"]["pressure_hpa"]),
-                    step=1
+                    step=1,
+                    key="env_pressure"
                 )
             with col2:
                 test_data["environment"]["wind_speed_mps"] = st.number_input(
                     "Wind Speed (m/s)", 
                     min_value=0.0, 
                     value=float(test_data["environment"]["wind_speed_mps"]),
-                    step=0.1
+                    step=0.1,
+                    key="env_wind_speed"
                 )
                 test_data["environment"]["wind_dir_deg"] = st.number_input(
                     "Wind Direction (degrees)", 
                     min_value=0, 
                     max_value=360, 
                     value=int(test_data["environment"]["wind_dir_deg"]),
-                    step=1
+                    step=1,
+                    key="env_wind_dir"
                 )
                 test_data["environment"]["weather"] = st.selectbox(
                     "Weather Conditions", 
-                    options=["Clear", "Overcast", "Rain", "Fog", "Variable"],
-                    index=["Clear", "Overcast", "Rain", "Fog", "Variable"].index(test_data["environment"]["weather"]) if test_data["environment"]["weather"] in ["Clear", "Overcast", "Rain", "Fog", "Variable"] else 0
+                    options=_WEATHER_OPTIONS,
+                    index=_WEATHER_INDEX.get(test_data["environment"]["weather"], 0),
+                    key="env_weather"
                 )
         
         # Tab 5: Results
@@ -1058,54 +1186,62 @@ def main():
                     "Number of Shots", 
                     min_value=1, 
                     value=int(test_data["group"]["shots"]),
-                    step=1
+                    step=1,
+                    key="group_shots"
                 )
                 
                 test_data["group"]["group_es_mm"] = st.number_input(
                     "Group Extreme Spread (mm)", 
                     min_value=0.0, 
                     value=float(test_data["group"]["group_es_mm"]),
-                    step=0.1
+                    step=0.1,
+                    key="group_es_mm"
                 )
                 
                 test_data["group"]["group_es_moa"] = st.number_input(
                     "Group Extreme Spread (MOA)", 
                     min_value=0.0, 
                     value=float(test_data["group"]["group_es_moa"]),
-                    step=0.01
+                    step=0.01,
+                    key="group_es_moa"
                 )
                 
                 test_data["group"]["mean_radius_mm"] = st.number_input(
                     "Mean Radius (mm)", 
                     min_value=0.0, 
                     value=float(test_data["group"]["mean_radius_mm"]),
-                    step=0.1
+                    step=0.1,
+                    key="mean_radius"
                 )
             with col2:
                 test_data["group"]["group_es_x_mm"] = st.number_input(
                     "Group Extreme Spread X (mm)", 
                     min_value=0.0, 
                     value=float(test_data["group"]["group_es_x_mm"]),
-                    step=0.1
+                    step=0.1,
+                    key="group_es_x"
                 )
                 
                 test_data["group"]["group_es_y_mm"] = st.number_input(
                     "Group Extreme Spread Y (mm)", 
                     min_value=0.0, 
                     value=float(test_data["group"]["group_es_y_mm"]),
-                    step=0.1
+                    step=0.1,
+                    key="group_es_y"
                 )
                 
                 test_data["group"]["poi_x_mm"] = st.number_input(
                     "Point of Impact X (mm)", 
                     value=float(test_data["group"]["poi_x_mm"]),
-                    step=0.1
+                    step=0.1,
+                    key="poi_x"
                 )
                 
                 test_data["group"]["poi_y_mm"] = st.number_input(
                     "Point of Impact Y (mm)", 
                     value=float(test_data["group"]["poi_y_mm"]),
-                    step=0.1
+                    step=0.1,
+                    key="poi_y"
                 )
             
             st.header("Chronograph Data")
@@ -1115,20 +1251,23 @@ def main():
                     "Average Velocity (fps)", 
                     min_value=0.0, 
                     value=float(test_data["chrono"]["avg_velocity_fps"]),
-                    step=0.1
+                    step=0.1,
+                    key="avg_velocity"
                 )
                 test_data["chrono"]["sd_fps"] = st.number_input(
                     "Standard Deviation (fps)", 
                     min_value=0.0, 
                     value=float(test_data["chrono"]["sd_fps"]),
-                    step=0.1
+                    step=0.1,
+                    key="sd_fps"
                 )
             with col2:
                 test_data["chrono"]["es_fps"] = st.number_input(
                     "Extreme Spread (fps)", 
                     min_value=0.0, 
                     value=float(test_data["chrono"]["es_fps"]),
-                    step=0.1
+                    step=0.1,
+                    key="es_fps"
                 )
         
         # Tab 6: Notes and Files
@@ -1139,20 +1278,23 @@ def main():
                 test_data["files"]["chrono_csv"] = st.text_input(
                     "Chronograph CSV", 
                     value=test_data["files"]["chrono_csv"],
-                    placeholder="e.g. chrono.csv"
+                    placeholder="e.g. chrono.csv",
+                    key="chrono_csv"
                 )
             with col2:
                 test_data["files"]["target_photo"] = st.text_input(
                     "Target Photo", 
                     value=test_data["files"]["target_photo"],
-                    placeholder="e.g. target.jpg"
+                    placeholder="e.g. target.jpg",
+                    key="target_photo"
                 )
             
             st.header("Notes")
             test_data["notes"] = st.text_area(
                 "Additional Notes", 
                 value=test_data["notes"],
-                height=200
+                height=200,
+                key="notes"
             )
         
         # Check if all required fields are filled for saving test data
@@ -1165,9 +1307,8 @@ def main():
             save_fields_filled = False
             
         # Submit button - make it more prominent
-        st.markdown("---")  # Add a separator
+        st.divider()
         st.markdown("### Save your changes")
-        st.markdown("") # Add extra space
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             if not save_fields_filled and new_test:
@@ -1176,7 +1317,6 @@ def main():
             submitted = st.form_submit_button("Save Test Data", 
                                              use_container_width=True,
                                              disabled=(new_test and not save_fields_filled))
-        st.markdown("") # Add extra space
         
         if submitted:
             if not test_data["test_id"]:
@@ -1186,15 +1326,36 @@ def main():
                 test_data["date"] = date.isoformat()
                 test_data["distance_m"] = distance_m
                 
-                # Save the data
-                utils.save_test_data(test_data["test_id"], test_data)
-                st.success(f"Test data for '{test_data['test_id']}' saved successfully!")
+                # Save the data, skipping the write when nothing differs from
+                # the saved file, e.g. when Save is pressed twice. The YAML
+                # file itself is compared, as it is what a save would rewrite
+                if test_data == utils.load_yaml(utils.get_test_file_path(test_data["test_id"])):
+                    st.info(f"No changes to save for '{test_data['test_id']}'.")
+                else:
+                    utils.save_test_data(test_data["test_id"], test_data)
+                    _cached_test_folders.clear()
+                    _cached_load.clear()
+                    st.success(f"Test data for '{test_data['test_id']}' saved successfully!")
                 
-                # If files were specified, check if they exist in the test folder
+                # If files were specified, check if they exist in the test
+                # folder, listing it once rather than checking each file
                 test_folder = os.path.join("tests", test_data["test_id"])
-                if test_data["files"]["chrono_csv"] and not os.path.exists(os.path.join(test_folder, test_data["files"]["chrono_csv"])):
+                try:
+                    with os.scandir(test_folder) as entries:
+                        present = {entry.name for entry in entries}
+                except OSError:
+                    present = set()
+                
+                def file_missing(name: str) -> bool:
+                    # The listing only holds the folder's own entries, so
+                    # names inside a subfolder are checked on disk
+                    if any(sep in name for sep in _PATH_SEPARATORS):
+                        return not os.path.exists(os.path.join(test_folder, name))
+                    return name not in present
+                
+                if test_data["files"]["chrono_csv"] and file_missing(test_data["files"]["chrono_csv"]):
                     st.warning(f"Note: Chronograph CSV file '{test_data['files']['chrono_csv']}' not found in test folder.")
-                if test_data["files"]["target_photo"] and not os.path.exists(os.path.join(test_folder, test_data["files"]["target_photo"])):
+                if test_data["files"]["target_photo"] and file_missing(test_data["files"]["target_photo"]):
                     st.warning(f"Note: Target photo '{test_data['files']['target_photo']}' not found in test folder.")
 
 
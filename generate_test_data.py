@@ -1,5 +1,4 @@
 import os
-import yaml
 import random
 import datetime
 import utils
@@ -7,8 +6,7 @@ from typing import Dict, Any
 
 # Load component lists
 def load_component_lists():
-    with open('Component_List.yaml', 'r') as file:
-        return yaml.safe_load(file)
+    return utils.load_yaml('Component_List.yaml')
 
 # Generate a random date in 2025
 def random_date_in_2025():
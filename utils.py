@@ -1,17 +1,34 @@
+import datetime
+import json
 import os
+import tempfile
 import yaml
-from typing import Dict, List, Any, Optional
+import streamlit as st
+from typing import Dict, List, Any, Optional, Tuple
+
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+COMPONENT_LIST_PATH = "Component_List.yaml"
 
 
 def load_component_lists() -> Dict[str, List[str]]:
     """
     Load component lists from the Component_List.yaml file.
     
+    The parsed lists are cached across Streamlit reruns and every caller
+    receives its own copy, so callers may mutate the result freely. The
+    cache is keyed on the file's modification time and size, so a save
+    from any page, including pages served by another Streamlit process,
+    is picked up on the next run.
+    
     Returns:
         Dictionary containing lists of components for dropdown menus
     """
-    component_list_path = "Component_List.yaml"
-    if not os.path.exists(component_list_path):
+    if not os.path.exists(COMPONENT_LIST_PATH):
         # Create default component lists if file doesn't exist
         default_lists = {
             "calibre": ["223", "308", "6.5CM"],
@@ -27,7 +44,21 @@ def load_component_lists() -> Dict[str, List[str]]:
         save_component_lists(default_lists)
         return default_lists
     
-    return load_yaml(component_list_path)
+    return _load_component_lists_cached(get_component_lists_version())
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _load_component_lists_cached(version: Tuple[int, int]) -> Dict[str, List[str]]:
+    """
+    Parse the Component_List.yaml file, cached per version of the file.
+    
+    Args:
+        version: Result of get_component_lists_version(), used as the cache key
+        
+    Returns:
+        Dictionary containing lists of components for dropdown menus
+    """
+    return load_yaml(COMPONENT_LIST_PATH)
 
 
 def save_component_lists(component_lists: Dict[str, List[str]]) -> None:
@@ -37,8 +68,28 @@ def save_component_lists(component_lists: Dict[str, List[str]]) -> None:
     Args:
         component_lists: Dictionary containing lists of components for dropdown menus
     """
-    component_list_path = "Component_List.yaml"
-    save_yaml(component_list_path, component_lists)
+    save_yaml(COMPONENT_LIST_PATH, component_lists)
+    
+    # Make the next load re-read the file we just wrote, even if its
+    # modification time and size happen to be unchanged
+    _load_component_lists_cached.clear()
+
+
+def get_component_lists_version() -> Tuple[int, int]:
+    """
+    Get the modification time and size of the Component_List.yaml file.
+    
+    A change in either means the file was written since it was last read.
+    
+    Returns:
+        Tuple of (modification time in nanoseconds, size in bytes), or
+        (0, 0) if the file does not exist
+    """
+    try:
+        stat = os.stat(COMPONENT_LIST_PATH)
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
 
 
 def load_yaml(file_path: str) -> Dict[str, Any]:
@@ -53,7 +104,7 @@ def load_yaml(file_path: str) -> Dict[str, Any]:
     """
     try:
         with open(file_path, 'r') as file:
-            data = yaml.safe_load(file)
+            data = yaml.load(file, Loader=YamlLoader)
             return data if data else {}
     except FileNotFoundError:
         return {}
@@ -61,7 +112,10 @@ def load_yaml(file_path: str) -> Dict[str, Any]:
 
 def save_yaml(file_path: str, data: Dict[str, Any]) -> None:
     """
-    Save a dictionary to a YAML file.
+    Save a dictionary to a YAML file, replacing any existing file atomically.
+
+    Readers such as the analysis page never see a partly written file, so
+    a test's modification time can be trusted once it changes.
 
     Args:
         file_path: Path where the YAML file will be saved
@@ -85,8 +139,97 @@ def save_yaml(file_path: str, data: Dict[str, Any]) -> None:
     # Register the custom representer
     yaml.add_representer(float, represent_float)
 
-    with open(file_path, 'w') as file:
-        yaml.dump(data, file, default_flow_style=False, sort_keys=False)
+    # Each save writes its own temporary file, so two sessions saving the
+    # same file at once cannot interleave their writes
+    fd, tmp_path = tempfile.mkstemp(
+        dir=dir_name or ".", prefix=f".{os.path.basename(file_path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, 'w') as file:
+            yaml.dump(data, file, default_flow_style=False, sort_keys=False)
+        # mkstemp() creates the file readable by its owner only, so give it
+        # the permissions of the file it replaces
+        try:
+            os.chmod(tmp_path, os.stat(file_path).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, file_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _json_default(value: Any) -> Dict[str, str]:
+    """
+    Encode the dates and times YAML can hold, which JSON has no type for.
+    
+    Args:
+        value: Value json could not serialize
+        
+    Returns:
+        Dictionary tagging the value's ISO format with its type
+    """
+    # datetime is a subclass of date, so it is checked first
+    if isinstance(value, datetime.datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"__date__": value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    """
+    Decode the dates and times written by _json_default.
+    
+    Args:
+        obj: Dictionary decoded from JSON
+        
+    Returns:
+        The date or datetime a tagged dictionary holds, otherwise obj itself
+    """
+    if len(obj) == 1:
+        if "__date__" in obj:
+            return datetime.date.fromisoformat(obj["__date__"])
+        if "__datetime__" in obj:
+            return datetime.datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+def save_json(file_path: str, data: Dict[str, Any]) -> None:
+    """
+    Save a dictionary to a JSON file, replacing any existing file atomically.
+    
+    Errors are ignored, as JSON files are only kept as a faster-to-parse
+    copy of the YAML files. Dates and times are tagged so they are read
+    back as the same types by load_json().
+    
+    Args:
+        file_path: Path where the JSON file will be saved
+        data: Dictionary to save as JSON
+    """
+    tmp_path = f"{file_path}.tmp"
+    try:
+        with open(tmp_path, 'w') as file:
+            json.dump(data, file, default=_json_default)
+        os.replace(tmp_path, file_path)
+    except (OSError, TypeError, ValueError):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_json(file_path: str) -> Any:
+    """
+    Load a JSON file written by save_json().
+    
+    Args:
+        file_path: Path to the JSON file
+        
+    Returns:
+        The decoded contents, with dates and times restored
+    """
+    with open(file_path, 'r') as file:
+        return json.load(file, object_hook=_json_object_hook)
 
 
 def get_test_folders() -> List[str]:
@@ -101,8 +244,10 @@ def get_test_folders() -> List[str]:
         os.makedirs(tests_dir, exist_ok=True)
         return []
     
-    return [folder for folder in os.listdir(tests_dir) 
-            if os.path.isdir(os.path.join(tests_dir, folder))]
+    # scandir reports the entry type from the directory listing itself, so
+    # no extra stat call is needed per folder
+    with os.scandir(tests_dir) as entries:
+        return [entry.name for entry in entries if entry.is_dir()]
 
 
 def get_test_file_path(test_name: str) -> str:
@@ -118,6 +263,19 @@ def get_test_file_path(test_name: str) -> str:
     return os.path.join("tests", test_name, "group.yaml")
 
 
+def get_test_json_path(test_name: str) -> str:
+    """
+    Get the path to a test's JSON sidecar file.
+    
+    Args:
+        test_name: Name of the test
+        
+    Returns:
+        Path to the test's JSON sidecar file
+    """
+    return os.path.join("tests", test_name, "group.json")
+
+
 def create_test_folder(test_name: str) -> str:
     """
     Create a new test folder.
@@ -137,6 +295,11 @@ def get_test_data(test_name: str) -> Dict[str, Any]:
     """
     Get the data for a specific test.
     
+    The JSON sidecar is read when the YAML file's modification time and
+    size still match the ones recorded in it. Otherwise the YAML file is
+    parsed and the sidecar rewritten from it, so any edit to the YAML file,
+    including copying in an older file, is picked up.
+    
     Args:
         test_name: Name of the test
         
@@ -144,7 +307,42 @@ def get_test_data(test_name: str) -> Dict[str, Any]:
         Dictionary containing the test data
     """
     file_path = get_test_file_path(test_name)
-    return load_yaml(file_path)
+    json_path = get_test_json_path(test_name)
+    try:
+        # Stat before parsing, so a write during the parse leaves a
+        # sidecar that no longer matches rather than one that looks current
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return {}
+    
+    try:
+        sidecar = load_json(json_path)
+        if (sidecar.get("yaml_mtime_ns") == stat.st_mtime_ns
+                and sidecar.get("yaml_size") == stat.st_size):
+            return sidecar["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
+    data = load_yaml(file_path)
+    if data:
+        _save_test_sidecar(test_name, stat, data)
+    return data
+
+
+def _save_test_sidecar(test_name: str, stat: os.stat_result, data: Dict[str, Any]) -> None:
+    """
+    Save the JSON sidecar of a test along with the YAML file it matches.
+    
+    Args:
+        test_name: Name of the test
+        stat: os.stat() of the YAML file the data was read from or saved to
+        data: Dictionary containing the test data
+    """
+    save_json(get_test_json_path(test_name), {
+        "yaml_mtime_ns": stat.st_mtime_ns,
+        "yaml_size": stat.st_size,
+        "data": data,
+    })
 
 
 def save_test_data(test_name: str, data: Dict[str, Any]) -> None:
@@ -158,3 +356,12 @@ def save_test_data(test_name: str, data: Dict[str, Any]) -> None:
     create_test_folder(test_name)
     file_path = get_test_file_path(test_name)
     save_yaml(file_path, data)
+    
+    # save_yaml() rounds floats to three decimals and writes whole floats as
+    # integers, so the sidecar is built from the saved file rather than from
+    # data, keeping it identical to what parsing the YAML file returns
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return
+    _save_test_sidecar(test_name, stat, load_yaml(file_path))